@@ -23,9 +23,15 @@ if get_platform() == "Windows" and 'Status' not in AUT_PATH:
     exit('Please use launcher from "Status" folder in "AUT_PATH"')
 AUT_PATH = SystemPath(AUT_PATH)
 WALLET_SEED = os.getenv('WALLET_TEST_USER_SEED')
+# Save and attach intermediate images of passed image checks too, not only of failed ones
+SAVE_IMAGE_ARTIFACTS = os.getenv('SAVE_IMAGE_ARTIFACTS', 'false').lower() == 'true'
+# Screen load time benchmarks, warmup runs are not recorded
+BENCHMARK_WARMUP = int(os.getenv('BENCHMARK_WARMUP', 1))
+BENCHMARK_ITERATIONS = int(os.getenv('BENCHMARK_ITERATIONS', 5))
 
 # Save application logs
 AUT_DIR = path.dirname(AUT_PATH)
-PYTEST_LOG = path.join(AUT_DIR, 'pytest.log')
-AUT_LOG_FILE = path.join(AUT_DIR, 'aut.log')
-SQUISH_LOG_FILE = path.join(AUT_DIR, 'squish.log')
+_LOG_SUFFIX = f'_{system.WORKER_ID}' if system.WORKER_ID else ''
+PYTEST_LOG = path.join(AUT_DIR, f'pytest{_LOG_SUFFIX}.log')
+AUT_LOG_FILE = path.join(AUT_DIR, f'aut{_LOG_SUFFIX}.log')
+SQUISH_LOG_FILE = path.join(AUT_DIR, f'squish{_LOG_SUFFIX}.log')
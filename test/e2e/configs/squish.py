@@ -1,5 +1,14 @@
 import os
 
-AUT_PORT = 61500 + int(os.getenv('EXECUTOR_NUMBER', 0))
-SERVER_PORT = 4322 + int(os.getenv('EXECUTOR_NUMBER', 0))
+from .system import WORKER_INDEX
+
+# Every xdist worker searches free ports in its own block of PORT_RANGE ports, and every executor inside
+# the block with a step of PORT_STEP, so ranges of parallel processes never overlap
+PORT_STEP = 10
+PORT_RANGE = 200
+PORT_OFFSET = int(os.getenv('EXECUTOR_NUMBER', 0)) % PORT_STEP + PORT_RANGE * WORKER_INDEX
+AUT_PORT = 61500 + PORT_OFFSET
+SERVER_PORT = 4322 + PORT_OFFSET
 CURSOR_ANIMATION = False
+# Number of pre-launched AUT instances kept by the AUT pool, 0 disables the pool
+AUT_POOL_SIZE = int(os.getenv('AUT_POOL_SIZE', 0))
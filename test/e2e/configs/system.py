@@ -7,5 +7,11 @@ def get_platform():
 
 
 DISPLAY = os.getenv('DISPLAY', ':0')
+# Linux only, "worker" starts one Xvfb per test process, "aut" one Xvfb per application instance
+VIRTUAL_DISPLAY = os.getenv('VIRTUAL_DISPLAY', 'off').lower()
+VIRTUAL_DISPLAY_SCREEN = os.getenv('VIRTUAL_DISPLAY_SCREEN', '1920x1080x24')
+# Set by pytest-xdist in worker processes, e.g. "gw0", None when tests run in a single process
+WORKER_ID = os.getenv('PYTEST_XDIST_WORKER')
+WORKER_INDEX = int(WORKER_ID[2:]) if WORKER_ID else 0
 TEST_MODE = os.getenv('STATUS_RUNTIME_TEST_MODE')
 
@@ -3,6 +3,7 @@ import typing
 from datetime import datetime
 
 from scripts.utils.system_path import SystemPath
+from .system import WORKER_ID
 
 ROOT: SystemPath = SystemPath(__file__).resolve().parent.parent
 
@@ -13,6 +14,8 @@ TEST_ARTIFACTS: typing.Optional[SystemPath] = None
 
 # Test Directories
 RUN_ID = os.getenv('RUN_DIR', f'run_{datetime.today().strftime("%Y-%m-%d %H-%M-%S")}')
+# xdist workers inherit the environment of the controller, so all of them write to the same run directory
+os.environ['RUN_DIR'] = RUN_ID
 RESULTS: SystemPath = ROOT / 'local_run_results'
 RUN: SystemPath = RESULTS / RUN_ID
 VP: SystemPath = ROOT / 'ext' / 'vp'
@@ -26,7 +29,11 @@ assert SQUISH_DIR_RAW is not None
 SQUISH_DIR = SystemPath(SQUISH_DIR_RAW)
 
 # Status Application
-STATUS_DATA: SystemPath = RUN
+# Every xdist worker keeps application data and user data templates of its AUTs apart
+STATUS_DATA: SystemPath = RUN / WORKER_ID if WORKER_ID else RUN
+USER_DATA_TEMPLATES: SystemPath = RUN / 'user_data_templates'
+if WORKER_ID:
+    USER_DATA_TEMPLATES = USER_DATA_TEMPLATES / WORKER_ID
 
 # Sets log level, can be one of: "ERROR", "WARN", "INFO", "DEBUG", "TRACE". "INFO"
 LOG_LEVEL = 'DEBUG'
@@ -7,3 +7,10 @@ PROCESS_TIMEOUT_SEC = 10
 APP_LOAD_TIMEOUT_MSEC = 60000
 MESSAGING_TIMEOUT_SEC = 60
 FEES_TIMEOUT_MSEC = 10000
+# Adaptive backoff between condition checks while waiting for UI state
+WAIT_MIN_INTERVAL_MSEC = 10
+WAIT_MAX_INTERVAL_MSEC = 250
+# Cached object handles are reused for this long unless an interaction happened in between
+OBJECT_HANDLE_TTL_MSEC = 500
+# Captured frame of the main window is reused for image checks within this time
+FRAME_CAPTURE_TTL_MSEC = 200
@@ -1,16 +1,20 @@
 import logging
 import configs
 import os
-import allure
+import signal
 import pytest
 import shortuuid
-import sys
-import subprocess
+import cv2
+import numpy as np
 
 from tests import test_data
 from PIL import ImageGrab
 from configs.system import get_platform
 from fixtures.path import generate_test_info
+from scripts.tools.artifacts import artifacts
+from scripts.tools.ocr import Ocr
+from scripts.utils import local_system
+from scripts.utils.git_metadata import get_run_metadata
 from scripts.utils.system_path import SystemPath
 
 # Send logs to pytest.log as well
@@ -27,94 +31,79 @@ LOG = logging.getLogger(__name__)
 
 pytest_plugins = [
     'fixtures.aut',
+    'fixtures.display',
     'fixtures.path',
     'fixtures.squish',
 ]
 
 
-def get_git_commit():
-    """Get git commit hash from parent repository"""
-    # Try to get git commit from parent repository (status-app)
-    try:
-        # Get parent directory (status-app)
-        parent_repo = configs.testpath.ROOT.parent.parent
-        result = subprocess.run(
-            ['git', 'rev-parse', 'HEAD'],
-            cwd=str(parent_repo),
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            commit_hash = result.stdout.strip()
-            return commit_hash
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-        LOG.debug(f'Could not get git commit: {e}')
-    
-    return None
-
-
-def get_status_go_commit():
-    """Get git commit hash from status-go repository"""
-    # Try to get git commit from status-go repository (vendor/status-go)
-    try:
-        # Get status-go directory (vendor/status-go)
-        status_go_repo = configs.testpath.ROOT.parent.parent / 'vendor' / 'status-go'
-        result = subprocess.run(
-            ['git', 'rev-parse', 'HEAD'],
-            cwd=str(status_go_repo),
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            commit_hash = result.stdout.strip()
-            return commit_hash
-    except (subprocess.TimeoutExpired, FileNotFoundError, Exception) as e:
-        LOG.debug(f'Could not get status-go git commit: {e}')
-    
-    return None
+run_metadata_key = pytest.StashKey[dict]()
 
 
-@pytest.fixture(scope='session', autouse=True)
-def generate_allure_environment():
+def _terminate(signum, frame):
+    # Process groups of the AUTs and the server do not get signals of the test process
+    local_system.kill_process_groups()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def pytest_configure(config):
+    if get_platform() != "Windows" and signal.getsignal(signal.SIGTERM) == signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _terminate)
+    # Git metadata is read once by the controller and passed to xdist workers
+    workerinput = getattr(config, 'workerinput', None)
+    if workerinput is not None and 'run_metadata' in workerinput:
+        config.stash[run_metadata_key] = workerinput['run_metadata']
+        return
+    metadata = get_run_metadata(configs.testpath.ROOT.parent.parent)
+    config.stash[run_metadata_key] = metadata
+    generate_allure_environment(metadata)
+
+
+def pytest_unconfigure(config):
+    # Also runs after Ctrl+C, which does not reach the process groups started by the tests
+    local_system.kill_process_groups()
+    if signal.getsignal(signal.SIGTERM) is _terminate:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput['run_metadata'] = node.config.stash[run_metadata_key]
+
+
+def generate_allure_environment(metadata: dict):
     """Generate allure environment.properties with dynamic platform information"""
     env_dir = configs.testpath.ROOT / 'ext' / 'allure_files'
-    env_file = env_dir / 'environment.properties'
-    
-    # Ensure directory exists
     env_dir.mkdir(parents=True, exist_ok=True)
-    
-    platform_name = get_platform()
-    python_version = f"Python {sys.version_info.major}.{sys.version_info.minor}"
-    git_commit = get_git_commit()
-    status_go_commit = get_status_go_commit()
-    
-    lines = [f"os_platform = {platform_name}"]
-    
-    if git_commit:
-        lines.append(f"status app commit hash = {git_commit}")
-    
-    if status_go_commit:
-        lines.append(f"status-go commit hash = {status_go_commit}")
-    
-    lines.append(f"python_version = {python_version}")
-    
-    content = "\n".join(lines) + "\n"
-    
-    env_file.write_text(content)
-    LOG.info(f'Generated allure environment.properties with platform={platform_name}, status app commit hash={git_commit}, status-go commit hash={status_go_commit}, python={python_version}')
-    yield
+
+    lines = [f"os_platform = {metadata['os_platform']}"]
+    if metadata['app_commit']:
+        lines.append(f"status app commit hash = {metadata['app_commit']}")
+    if metadata['status_go_commit']:
+        lines.append(f"status-go commit hash = {metadata['status_go_commit']}")
+    lines.append(f"python_version = {metadata['python_version']}")
+
+    (env_dir / 'environment.properties').write_text("\n".join(lines) + "\n")
+    LOG.info(f'Generated allure environment.properties with {metadata}')
+
+
+@pytest.fixture(scope='session')
+def run_metadata(request) -> dict:
+    """Platform and commit hashes of the run, the same values that are written to allure environment"""
+    return request.config.stash[run_metadata_key]
 
 
 @pytest.fixture(scope='session', autouse=True)
 def setup_session_scope(
-        generate_allure_environment,
         prepare_test_directory,
+        virtual_display,
         start_squish_server
 ):
     LOG.info('Session startup...')
     yield
+    artifacts.close()
+    Ocr.close()
 
 
 @pytest.fixture(autouse=True)
@@ -129,6 +118,16 @@ def setup_function_scope(
     yield
 
 
+def pytest_collection_modifyitems(config, items):
+    # With "--dist loadgroup" tests using the same user data run on the same worker and reuse its warm AUTs
+    if not config.pluginmanager.hasplugin('xdist'):
+        return
+    for item in items:
+        user_data = getattr(item, 'callspec', None) and item.callspec.params.get('user_data')
+        if user_data is not None:
+            item.add_marker(pytest.mark.xdist_group(SystemPath(user_data).name))
+
+
 def pytest_runtest_setup(item):
     test_data.test_name = item.name
 
@@ -156,17 +155,18 @@ def pytest_runtest_makereport(item, call):
         test_data.error = rep.longreprtext
 
 
+def pytest_runtest_logfinish(nodeid, location):
+    # After the teardown phase, so artifacts of fixture teardowns and teardown failures belong to the test
+    artifacts.flush()
+
+
 def pytest_exception_interact(node):
     test_path, test_name, test_params = generate_test_info(node)
     node_dir: SystemPath = configs.testpath.RUN / test_path / test_name / test_params
     node_dir.mkdir(parents=True, exist_ok=True)
     screenshot = node_dir / f'screenshot_{shortuuid.ShortUUID().random(length=10)}.png'
     try:
-        ImageGrab.grab(xdisplay=configs.system.DISPLAY if get_platform() == "Linux" else None).save(screenshot)
-        allure.attach(
-            name='Screenshot on fail',
-            body=screenshot.read_bytes(),
-            attachment_type=allure.attachment_type.PNG
-        )
-    except FileNotFoundError:
+        img = ImageGrab.grab(xdisplay=configs.system.DISPLAY if get_platform() == "Linux" else None)
+        artifacts.save_image(cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR), screenshot, 'Screenshot on fail')
+    except OSError:
         print("Screenshot was not generated or saved")
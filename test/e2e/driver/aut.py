@@ -1,4 +1,8 @@
-import time
+import collections
+import os
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
 
 import allure
 import logging
@@ -15,8 +19,11 @@ from configs.system import get_platform
 from driver import context
 from driver.server import SquishServer
 from gui.objects_map.names import statusDesktop_mainWindow
+from scripts.tools.artifacts import artifacts
+from scripts.tools.image import frame_capture
 from scripts.utils import system_path, local_system
 from scripts.utils.system_path import SystemPath
+from scripts.utils.virtual_display import VirtualDisplay
 from scripts.utils.wait_for_port import wait_for_port
 import psutil
 
@@ -24,6 +31,10 @@ LOG = logging.getLogger(__name__)
 
 
 class AUT:
+    # Displays of attached AUTs, the last one is configs.system.DISPLAY, and the display they replaced
+    _attached_displays: typing.List[str] = []
+    _base_display: typing.Optional[str] = None
+
     def __init__(
             self,
             app_path: system_path.SystemPath = configs.AUT_PATH,
@@ -33,12 +44,14 @@ class AUT:
         self.ctx = None
         self.pid = None
         self.port = None
-        self.aut_id = f'AUT_{datetime.now():%H%M%S}'
+        self.display = None
+        self.aut_id = f'AUT_{datetime.now():%H%M%S%f}'
         self.app_data = configs.testpath.STATUS_DATA / f'app_{shortuuid.ShortUUID().random(length=10)}'
         if user_data is not None:
-            user_data.copy_to(self.app_data / 'data')
+            user_data.snapshot_to(self.app_data / 'data', configs.testpath.USER_DATA_TEMPLATES)
         self.options = ''
-        driver.testSettings.setWrappersForApplication(self.aut_id, ['Qt'])
+        # Squish API calls are made on the test thread in attach(), pooled instances are created in the background
+        self._wrappers_set = False
 
     def __str__(self):
         return type(self).__qualname__
@@ -51,7 +64,6 @@ class AUT:
             try:
                 self.attach()
                 driver.waitForObjectExists(statusDesktop_mainWindow).setVisible(True)
-                configs.testpath.TEST.mkdir(parents=True, exist_ok=True)
                 screenshot = configs.testpath.TEST / f'{self.aut_id}.png'
 
                 rect = driver.object.globalBounds(driver.waitForObject(statusDesktop_mainWindow))
@@ -59,12 +71,7 @@ class AUT:
                     bbox=(rect.x, rect.y, rect.x + rect.width, rect.y + rect.height),
                     xdisplay=configs.system.DISPLAY if get_platform() == "Linux" else None)
                 view = cv2.cvtColor(np.array(img), cv2.COLOR_BGR2RGB)
-                cv2.imwrite(str(screenshot), view)
-
-                allure.attach(
-                    name=f'Screenshot on fail: {self.aut_id}',
-                    body=screenshot.read_bytes(),
-                    attachment_type=allure.attachment_type.PNG)
+                artifacts.save_image(view, screenshot, f'Screenshot on fail: {self.aut_id}')
             except Exception as err:
                 LOG.error(err)
 
@@ -81,10 +88,16 @@ class AUT:
         LOG.info('Attaching to AUT: localhost:%d', self.port)
 
         try:
+            if not self._wrappers_set:
+                driver.testSettings.setWrappersForApplication(self.aut_id, ['Qt'])
+                self._wrappers_set = True
             SquishServer().add_attachable_aut(self.aut_id, self.port)
             if self.ctx is None:
                 self.ctx = context.get_context(self.aut_id)
             driver.setApplicationContext(self.ctx)
+            if self.display is not None:
+                # Screenshots follow the application the test works with
+                self._push_display(self.display.name)
             assert squish.waitFor(lambda: self.ctx.isRunning, configs.timeouts.PROCESS_TIMEOUT_SEC)
         except Exception as err:
             LOG.error('Failed to attach AUT: %s', err)
@@ -96,7 +109,8 @@ class AUT:
     @allure.step('Start AUT')
     def startaut(self):
         LOG.info('Launching AUT: %s', self.path)
-        self.port = local_system.find_free_port(configs.squish.AUT_PORT, 100)
+        self.port = local_system.find_free_port(
+            configs.squish.AUT_PORT, configs.squish.PORT_STEP, configs.squish.AUT_PORT + configs.squish.PORT_RANGE)
         command = [
             str(configs.testpath.SQUISH_DIR / 'bin/startaut'),
             '--verbose',
@@ -107,8 +121,12 @@ class AUT:
             '--api-logging'
         ]
         try:
+            env = None
+            if configs.system.VIRTUAL_DISPLAY == 'aut' and get_platform() == "Linux":
+                self.display = VirtualDisplay().start()
+                env = dict(os.environ, DISPLAY=self.display.name)
             with open(configs.AUT_LOG_FILE, "ab") as log:
-                self.pid = local_system.execute(command, stderr=log, stdout=log)
+                self.pid = local_system.execute(command, stderr=log, stdout=log, env=env, new_session=True)
         except Exception as err:
             LOG.error('Failed to start AUT: %s', err)
             self.stop()
@@ -121,48 +139,43 @@ class AUT:
         LOG.info('Stopping AUT: %s', self.path)
         self.detach_context()
         if self.pid:
-            local_system.kill_process(self.pid)
-            # Wait for process to exit with timeout to avoid hanging on Windows CI
-            max_wait_seconds = 5
-            check_interval = 0.1
-            elapsed = 0
-            
-            while elapsed < max_wait_seconds:
-                try:
-                    # Check if process is still running using psutil
-                    if psutil:
-                        try:
-                            proc = psutil.Process(self.pid)
-                            if not proc.is_running():
-                                LOG.info('Process %d exited', self.pid)
-                                break
-                        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                            # Process doesn't exist or can't be checked
-                            LOG.info('Process %d no longer exists', self.pid)
-                            break
-                    else:
-                        # If psutil not available, use shorter wait
-                        elapsed = max_wait_seconds
-                        break
-                except Exception as e:
-                    LOG.debug('Error checking process status: %s', e)
-                    # Continue and let timeout handle it
-                
-                # Calculate sleep duration before incrementing elapsed, ensuring it's non-negative
-                remaining = max_wait_seconds - elapsed
-                sleep_duration = min(check_interval, max(0, remaining))
-                if sleep_duration > 0:
-                    time.sleep(sleep_duration)
-                
-                elapsed += check_interval
-            
-            if elapsed >= max_wait_seconds and psutil:
-                LOG.warning('Process %d may still be running after %d seconds', self.pid, max_wait_seconds)
+            # Wait with timeout to avoid hanging on Windows CI
+            local_system.stop_process(self.pid, timeout_sec=5)
+            self.pid = None
+        if self.port is not None:
+            local_system.release_port(self.port)
+        if self.display is not None:
+            self._pop_display(self.display.name)
+            self.display.stop()
+            self.display = None
+
+    @classmethod
+    def _push_display(cls, name: str):
+        if not cls._attached_displays:
+            cls._base_display = configs.system.DISPLAY
+        if name in cls._attached_displays:
+            cls._attached_displays.remove(name)
+        cls._attached_displays.append(name)
+        configs.system.DISPLAY = name
+        frame_capture.invalidate()
+
+    @classmethod
+    def _pop_display(cls, name: str):
+        if name not in cls._attached_displays:
+            return
+        cls._attached_displays.remove(name)
+        # Screenshots go back to the display of the previously attached AUT or the one of the session
+        display = cls._attached_displays[-1] if cls._attached_displays else cls._base_display
+        if configs.system.DISPLAY != display:
+            configs.system.DISPLAY = display
+            frame_capture.invalidate()
 
     @allure.step("Start and attach AUT")
     def launch(self) -> 'AUT':
-        self.startaut()
-        self.wait()
+        # Instances leased from the AUT pool are already started and listening
+        if self.pid is None:
+            self.startaut()
+            self.wait()
         self.attach()
         return self
 
@@ -197,3 +210,106 @@ class AUT:
     def restart(self):
         self.stop()
         self.launch()
+
+
+class AUTPool:
+    """Keeps pre-launched and pre-registered AUT instances with fresh data directories.
+
+    Instances are started and registered as attachable in the background, tests lease a ready
+    instance and the pool replaces it with a new one once the lease is released. The pool holds at
+    most "size" instances over all user_data profiles, when it is full the oldest idle instance of
+    another profile is evicted to make room for the profile just released.
+    """
+
+    def __init__(self, size: int, app_path: SystemPath = configs.AUT_PATH):
+        self.size = size
+        self.app_path = app_path
+        self._idle = collections.defaultdict(collections.deque)
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='aut_pool')
+
+    @property
+    def idle_data_dirs(self) -> list:
+        with self._lock:
+            return [aut.app_data for auts in self._idle.values() for aut in auts]
+
+    def warm_up(self, user_data: SystemPath = None):
+        with self._lock:
+            count = self.size - sum(map(len, self._idle.values())) - self._pending
+            if count <= 0:
+                return
+            self._pending += count
+        self._executor.submit(self._prepare, user_data, count)
+
+    def _schedule(self, user_data: SystemPath = None):
+        evicted = None
+        with self._lock:
+            if sum(map(len, self._idle.values())) + self._pending >= self.size:
+                evicted = self._evict_other(user_data)
+                if evicted is None:
+                    return
+            self._pending += 1
+        if evicted is not None:
+            LOG.info('Evicting pooled AUT %s to make room for another profile', evicted.aut_id)
+            evicted.stop()
+        self._executor.submit(self._prepare, user_data)
+
+    def _evict_other(self, user_data: SystemPath = None):
+        # Called with the lock held
+        for profile, idle in self._idle.items():
+            if profile != user_data and idle:
+                return idle.popleft()
+        return None
+
+    def _prepare(self, user_data: SystemPath = None, count: int = 1):
+        started = []
+        for _ in range(count):
+            aut = None
+            try:
+                aut = AUT(app_path=self.app_path, user_data=user_data)
+                aut.startaut()
+                aut.wait()
+                started.append(aut)
+            except Exception as err:
+                LOG.error('Failed to prepare pooled AUT: %s', err)
+                if aut is not None:
+                    aut.stop()
+        try:
+            # Registered here, so attach on the test thread finds them in the cache and skips squishserver
+            for aut in started:
+                SquishServer().add_attachable_aut(aut.aut_id, aut.port)
+        except Exception as err:
+            LOG.error('Failed to register pooled AUTs: %s', err)
+            for aut in started:
+                aut.stop()
+            started = []
+        with self._lock:
+            self._pending -= count
+            self._idle[user_data].extend(started)
+        for aut in started:
+            LOG.info('Pooled AUT %s is ready on port: %d', aut.aut_id, aut.port)
+
+    def lease(self, user_data: SystemPath = None) -> AUT:
+        with self._lock:
+            idle = self._idle[user_data]
+            while idle:
+                aut = idle.popleft()
+                if aut.pid is not None and psutil.pid_exists(aut.pid):
+                    LOG.info('Leased pooled AUT %s', aut.aut_id)
+                    return aut
+                LOG.warning('Pooled AUT %s is not running anymore', aut.aut_id)
+        LOG.info('No pooled AUT ready, creating a new one')
+        return AUT(app_path=self.app_path, user_data=user_data)
+
+    def release(self, aut: AUT, user_data: SystemPath = None):
+        aut.stop()
+        self._schedule(user_data)
+
+    def close(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            auts = [aut for auts in self._idle.values() for aut in auts]
+            self._idle.clear()
+        for aut in auts:
+            aut.stop()
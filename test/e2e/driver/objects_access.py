@@ -1,6 +1,8 @@
 import logging
 import time
+import typing
 
+import allure
 import object
 import squish
 
@@ -16,6 +18,76 @@ def walk_children(parent, depth: int = 1000):
             yield from walk_children(child, depth - 1)
 
 
+class ObjectTreeIndex:
+    """Index of a QML subtree built with a single walk, keyed by objectName, type and id.
+
+    The subtree is walked again only when the child count of the container changes or when a child
+    found by key no longer matches it, e.g. after a delegate was reused for another model item.
+    """
+    KEYS = ('objectName', 'type', 'id')
+
+    def __init__(self, keys: typing.Tuple[str, ...] = KEYS, depth: int = 1000):
+        self.keys = keys
+        self.depth = depth
+        self._parent = None
+        self._child_count = None
+        self._index = {key: {} for key in self.keys}
+
+    @staticmethod
+    def _get_key(child, key: str) -> str:
+        if key == 'type':
+            return str(squish.className(child))
+        return str(getattr(child, key, ''))
+
+    @staticmethod
+    def _get_child_count(parent) -> int:
+        count = getattr(parent, 'count', None)
+        return int(count) if count is not None else len(object.children(parent))
+
+    def _build(self, parent):
+        self._index = {key: {} for key in self.keys}
+        for child in walk_children(parent, self.depth):
+            try:
+                for key in self.keys:
+                    self._index[key].setdefault(self._get_key(child, key), []).append(child)
+            except RuntimeError:
+                # Child was destroyed during the walk
+                continue
+        LOG.debug('Object tree indexed: %d nodes', sum(map(len, self._index[self.keys[0]].values())))
+
+    def update(self, parent) -> 'ObjectTreeIndex':
+        child_count = self._get_child_count(parent)
+        if child_count != self._child_count:
+            self._build(parent)
+            self._child_count = child_count
+        self._parent = parent
+        return self
+
+    def _matches(self, child, key: str, value: str) -> bool:
+        try:
+            return self._get_key(child, key) == value
+        except RuntimeError:
+            # Child was destroyed in the AUT
+            return False
+
+    def find_all(self, key: str, value: str) -> list:
+        children = list(self._index[key].get(value, []))
+        if self._parent is None or all(self._matches(child, key, value) for child in children):
+            return children
+        self._build(self._parent)
+        return list(self._index[key].get(value, []))
+
+    def find(self, key: str, value: str):
+        for child in self._index[key].get(value, []):
+            if self._matches(child, key, value):
+                return child
+        if self._parent is None:
+            return None
+        self._build(self._parent)
+        children = self._index[key].get(value, [])
+        return children[0] if children else None
+
+
 def wait_for_template(
         real_name_template: dict, value: str, attr_name: str, timeout_sec: int = configs.timeouts.UI_LOAD_TIMEOUT_SEC):
     started_at = time.monotonic()
@@ -30,3 +102,30 @@ def wait_for_template(
             if time.monotonic() - started_at > timeout_sec:
                 raise RuntimeError(f'Value not found in: {values}')
         time.sleep(1)
+
+
+def wait_for_condition(condition, timeout_msec: int, description: str = 'condition') -> bool:
+    """Evaluates condition until it returns True or timeout_msec passes.
+
+    The delay between checks starts at WAIT_MIN_INTERVAL_MSEC and doubles up to WAIT_MAX_INTERVAL_MSEC,
+    so quick UI changes are caught within milliseconds while long waits do not flood the AUT with requests.
+    The time spent waiting is attached to the current allure step.
+    """
+    started_at = time.monotonic()
+    deadline = started_at + timeout_msec / 1000
+    interval_sec = configs.timeouts.WAIT_MIN_INTERVAL_MSEC / 1000
+    result = False
+    while True:
+        try:
+            result = bool(condition())
+        except Exception as err:
+            LOG.debug('Exception while waiting for %s: %s', description, err)
+        now = time.monotonic()
+        if result or now >= deadline:
+            break
+        time.sleep(min(interval_sec, deadline - now))
+        interval_sec = min(interval_sec * 2, configs.timeouts.WAIT_MAX_INTERVAL_MSEC / 1000)
+    elapsed_msec = int((time.monotonic() - started_at) * 1000)
+    LOG.debug('Waited %d ms for %s: %s', elapsed_msec, description, result)
+    allure.attach(f'{elapsed_msec} ms', name=f'Waited for {description}', attachment_type=allure.attachment_type.TEXT)
+    return result
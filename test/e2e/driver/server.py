@@ -1,5 +1,5 @@
 import logging
-import time
+import threading
 import typing
 
 import configs.testpath
@@ -14,10 +14,15 @@ LOG = logging.getLogger(__name__)
 class SquishServer:
     __instance = None
     path = configs.testpath.SQUISH_DIR / 'bin' / 'squishserver'
-    config = configs.testpath.ROOT / 'squish.ini'
+    # Every xdist worker runs its own server with its own config
+    config = configs.testpath.ROOT / (
+        f'squish_{configs.system.WORKER_ID}.ini' if configs.system.WORKER_ID else 'squish.ini')
     host = '127.0.0.1'
     port = None
     pid = None
+    # Attachable AUTs already written to the config: aut_id -> port
+    _attachable_auts: typing.Dict[str, int] = {}
+    _config_lock = threading.Lock()
 
     def __new__(cls):
         if not SquishServer.__instance:
@@ -26,7 +31,9 @@ class SquishServer:
 
     @classmethod
     def start(cls):
-        cls.port = local_system.find_free_port(configs.squish.SERVER_PORT, 100)
+        cls.port = local_system.find_free_port(
+            configs.squish.SERVER_PORT, configs.squish.PORT_STEP,
+            configs.squish.SERVER_PORT + configs.squish.PORT_RANGE)
         LOG.info('Starting Squish Server on port: %d', cls.port)
         cmd = [
             str(cls.path),
@@ -36,15 +43,16 @@ class SquishServer:
             f'--port={cls.port}',
         ]
         with open(configs.SQUISH_LOG_FILE, "ab") as log:
-            cls.pid = local_system.execute(cmd, stderr=log, stdout=log)
+            cls.pid = local_system.execute(cmd, stderr=log, stdout=log, new_session=True)
+        cls._attachable_auts.clear()
 
     @classmethod
     def stop(cls):
         if cls.pid is None:
             return
         LOG.info('Stopping Squish Server with PID: %d', cls.pid)
-        local_system.kill_process(cls.pid)
-        time.sleep(1) # FIXME: Implement waiting for process to actually exit.
+        local_system.stop_process(cls.pid)
+        local_system.release_port(cls.port)
         cls.pid = None
         cls.port = None
 
@@ -68,4 +76,9 @@ class SquishServer:
 
     @classmethod
     def add_attachable_aut(cls, aut_id: str, port: int):
-        cls.configuring('addAttachableAUT', [aut_id, f'localhost:{port}'])
+        with cls._config_lock:
+            if cls._attachable_auts.get(aut_id) == port:
+                LOG.debug('Attachable AUT %s is already registered on port: %d', aut_id, port)
+                return
+            cls.configuring('addAttachableAUT', [aut_id, f'localhost:{port}'])
+            cls._attachable_auts[aut_id] = port
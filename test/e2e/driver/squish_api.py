@@ -1,8 +1,34 @@
+import functools
 import time
 
+import squishtest
+
 import configs.timeouts
 import driver
 
+# Called after every input sent to the AUT, e.g. to drop object handles resolved before it
+interaction_listeners = []
+
+_INPUT_FUNCTIONS = (
+    'mouseClick', 'doubleClick', 'mouseMove', 'mousePress', 'mouseRelease', 'mouseDrag', 'mouseWheel',
+    'nativeMouseClick', 'tapObject', 'type', 'nativeType', 'keyPress', 'keyRelease',
+)
+
+
+def _input(name: str):
+    @functools.wraps(getattr(squishtest, name))
+    def wrapper(*args, **kwargs):
+        try:
+            return getattr(squishtest, name)(*args, **kwargs)
+        finally:
+            for listener in interaction_listeners:
+                listener()
+
+    return wrapper
+
+
+globals().update({name: _input(name) for name in _INPUT_FUNCTIONS if hasattr(squishtest, name)})
+
 
 # def waitFor(condition, timeout_msec: int = configs.timeouts.UI_LOAD_TIMEOUT_MSEC) -> bool:
 #     started_at = time.monotonic()
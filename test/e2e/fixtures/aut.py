@@ -5,8 +5,9 @@ import pytest
 import logging
 import constants
 from constants.user import *
-from driver.aut import AUT
+from driver.aut import AUT, AUTPool
 from gui.main_window import MainWindow
+from scripts.tools.artifacts import artifacts
 from scripts.utils import system_path
 from scripts.utils.system_path import SystemPath
 
@@ -27,25 +28,37 @@ def launch_keycard_controller(request):
         os.environ['STATUS_RUNTIME_USE_MOCKED_KEYCARD'] = 'True'
 
 
+@pytest.fixture(scope='session')
+def aut_pool(virtual_display, start_squish_server) -> AUTPool:
+    if configs.squish.AUT_POOL_SIZE <= 0 or not configs.AUT_PATH.exists():
+        yield None
+        return
+    LOG.info('Warming up AUT pool with %d instances', configs.squish.AUT_POOL_SIZE)
+    pool = AUTPool(configs.squish.AUT_POOL_SIZE)
+    pool.warm_up()
+    yield pool
+    LOG.info('Stopping AUT pool...')
+    pool.close()
+
+
 @pytest.fixture
-def application_logs():
+def application_logs(aut_pool):
     yield
     if not configs.testpath.STATUS_DATA.exists():
         LOG.info('No data folder found')
         return
 
+    idle_data_dirs = aut_pool.idle_data_dirs if aut_pool is not None else []
     for app_data in configs.testpath.STATUS_DATA.iterdir():
+        if app_data in idle_data_dirs:
+            continue
         for log_dir in ['logs', 'data', 'data/keycard']:
             log_path = app_data / log_dir
             if not log_path.exists():
                 continue
 
             for log in log_path.glob('*.log'):
-                try:
-                    allure.attach.file(log, name=str(log.name), attachment_type=allure.attachment_type.TEXT)
-                    log.unlink()  # FIXME: it does not work on Windows, permission error
-                except Exception as e:
-                    LOG.info(f"Unexpected error processing {log}: {e}")
+                artifacts.attach_file(log, str(log.name), allure.attachment_type.TEXT, unlink=True)
 
 
 @pytest.fixture
@@ -57,21 +70,33 @@ def user_data(request) -> system_path.SystemPath:
 
 
 @pytest.fixture
-def aut(user_data) -> AUT:
+def aut(user_data, aut_pool) -> AUT:
     if not configs.AUT_PATH.exists():
         pytest.exit(f"Application not found: {configs.AUT_PATH}")
-    _aut = AUT(user_data=user_data)
+    if aut_pool is None:
+        yield AUT(user_data=user_data)
+        return
+    _aut = aut_pool.lease(user_data)
     yield _aut
+    aut_pool.release(_aut, user_data)
 
 
 @pytest.fixture()
-def multiple_instances(user_data):
+def multiple_instances(user_data, aut_pool):
+    leased = []
+
     def _aut(user_data: SystemPath = None) -> AUT:
         if not configs.AUT_PATH.exists():
             pytest.exit(f"Application not found: {configs.AUT_PATH}")
-        return AUT(user_data=user_data)
+        if aut_pool is None:
+            return AUT(user_data=user_data)
+        instance = aut_pool.lease(user_data)
+        leased.append((instance, user_data))
+        return instance
 
     yield _aut
+    for instance, data in leased:
+        aut_pool.release(instance, data)
 
 
 @pytest.fixture
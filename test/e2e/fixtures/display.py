@@ -0,0 +1,18 @@
+import pytest
+
+import configs
+from configs.system import get_platform
+from scripts.utils.virtual_display import VirtualDisplay, use_display
+
+
+@pytest.fixture(scope='session')
+def virtual_display():
+    if configs.system.VIRTUAL_DISPLAY != 'worker' or get_platform() != 'Linux':
+        yield None
+        return
+    display = VirtualDisplay().start()
+    previous = configs.system.DISPLAY
+    use_display(display.name)
+    yield display
+    use_display(previous)
+    display.stop()
@@ -13,19 +13,29 @@ LOG = logging.getLogger(__name__)
 
 class List(QObject):
 
+    @staticmethod
+    def _get_count(real_name) -> int:
+        try:
+            return int(driver.findObject(real_name).count)
+        except (LookupError, RuntimeError, AttributeError):
+            return -1
+
+    def _read_rows(self, attr_name: str) -> typing.Iterator[typing.Tuple[str, object]]:
+        # Resolves the list and its count once per pass, then reads the attribute row by row
+        obj = self.object
+        for index in range(obj.count):
+            item = obj.itemAtIndex(index)
+            yield str(getattr(item, attr_name, '')), item
+
     @property
     @allure.step('Get list items {0}')
     def items(self):
-        return [self.object.itemAtIndex(index) for index in range(self.object.count)]
+        obj = self.object
+        return [obj.itemAtIndex(index) for index in range(obj.count)]
 
     @allure.step('Get values of list items {0}')
     def get_values(self, attr_name: str) -> typing.List[str]:
-        values = []
-        for index in range(self.object.count):
-            value = str(getattr(self.object.itemAtIndex(index), attr_name, ''))
-            if value:
-                values.append(value)
-        return values
+        return [value for value, _ in self._read_rows(attr_name) if value]
 
     @allure.step('Select item {1} in {0}')
     def select(self, value: str, attr_name: str):
@@ -35,14 +45,16 @@ class List(QObject):
     @allure.step('Wait for item {1} in {0} with attribute {2}')
     def wait_for_item(self, value: str, attr_name: str, timeout_sec: int = configs.timeouts.UI_LOAD_TIMEOUT_SEC):
         started_at = time.monotonic()
-        values = []
         while True:
-            for index in range(self.object.count):
-                cur_value = str(getattr(self.object.itemAtIndex(index), attr_name, ''))
+            row_count = self._get_count(self.real_name)
+            values = set()
+            for cur_value, item in self._read_rows(attr_name):
                 if cur_value == value:
                     LOG.info(f'{self}: "{value}" for attribute "{attr_name}" appeared')
-                    return self.object.itemAtIndex(index)
-                values.append(cur_value)
-            time.sleep(1)
-            if time.monotonic() - started_at > timeout_sec:
-                raise RuntimeError(f'value not found in list: {values}')
+                    return item
+                values.add(cur_value)
+            remaining_msec = int((timeout_sec - (time.monotonic() - started_at)) * 1000)
+            if remaining_msec <= 0:
+                raise RuntimeError(f'value not found in list: {sorted(values)}')
+            # Wake up as soon as rows are added or removed, rows loading their data are read again after a second
+            driver.waitFor(lambda: self._get_count(self.real_name) != row_count, min(remaining_msec, 1000))
@@ -1,36 +1,121 @@
 import logging
 import time
 import typing
+import warnings
+from dataclasses import dataclass
 
 import allure
 
 import configs
 import driver
-from scripts.tools.image import Image
+from driver.objects_access import wait_for_condition
+from scripts.tools.image import Image, frame_capture
 
 LOG = logging.getLogger(__name__)
 
 
+def _warn_check_interval(check_interval):
+    if check_interval is not None:
+        warnings.warn(
+            'check_interval is ignored, waits back off adaptively between checks',
+            DeprecationWarning, stacklevel=3)
+
+
+@dataclass
+class ObjectSnapshot:
+    bounds: object = None
+    visible: bool = False
+    enabled: bool = False
+    text: typing.Optional[str] = None
+
+
 class QObject:
+    # Incremented on every interaction, cached handles resolved before it are not reused
+    _interaction = 0
+    _handle = None
+    _handle_name = None
+    _handle_interaction = -1
+    _handle_resolved_at = 0.0
 
     def __init__(self, real_name: [str, dict] = None):
-        self.real_name = real_name
+        # Own copy of the map entry, parametrized names like real_name['index'] = index stay local to the instance.
+        # Containers are shared with the object map, they are never changed in place.
+        self.real_name = dict(real_name) if isinstance(real_name, dict) else real_name
         self._image = Image(self.real_name)
 
     @property
     @allure.step('Get object {0}')
     def object(self):
+        if self._is_handle_valid():
+            # Same readiness as waitForObject, otherwise wait for the object below
+            try:
+                if self._handle.visible and getattr(self._handle, 'enabled', True):
+                    return self._handle
+            except RuntimeError:
+                pass
+            self.invalidate()
         try:
-            return driver.waitForObject(self.real_name, configs.timeouts.UI_LOAD_TIMEOUT_MSEC)
+            obj = driver.waitForObject(self.real_name, configs.timeouts.UI_LOAD_TIMEOUT_MSEC)
         except LookupError as e:
             raise Exception(
                 f"Object {self.real_name} was not found within {configs.timeouts.UI_LOAD_TIMEOUT_MSEC} ms") from e
+        self._cache_handle(obj)
+        return obj
+
+    def _is_handle_valid(self) -> bool:
+        return (
+                self._handle is not None and
+                self._handle_interaction == QObject._interaction and
+                time.monotonic() - self._handle_resolved_at < configs.timeouts.OBJECT_HANDLE_TTL_MSEC / 1000 and
+                self._handle_name == self.real_name
+        )
+
+    def _cache_handle(self, obj):
+        self._handle = obj
+        # Shallow copy to notice parametrized names like real_name['index'] = index, containers are never changed
+        self._handle_name = dict(self.real_name) if isinstance(self.real_name, dict) else self.real_name
+        self._handle_interaction = QObject._interaction
+        self._handle_resolved_at = time.monotonic()
+
+    def invalidate(self):
+        self._handle = None
+
+    @classmethod
+    def _interacted(cls):
+        QObject._interaction += 1
+        frame_capture.invalidate()
+
+    def _read(self, getter):
+        # Retries once with a freshly resolved object if the cached one was destroyed in the AUT
+        cached = self._is_handle_valid()
+        try:
+            return getter(self.object)
+        except RuntimeError:
+            if not cached:
+                raise
+            self.invalidate()
+            return getter(self.object)
 
     def set_text_property(self, text):
-        self.object.forceActiveFocus()
-        self.object.clear()
-        self.object.text = text
-        assert self.object.text == text, 'Text was not set'
+        obj = self.object
+        obj.forceActiveFocus()
+        obj.clear()
+        obj.text = text
+        self._interacted()
+        assert obj.text == text, 'Text was not set'
+
+    @allure.step('Get snapshot {0}')
+    def snapshot(self) -> ObjectSnapshot:
+        def _snapshot(obj):
+            text = getattr(obj, 'text', None)
+            return ObjectSnapshot(
+                bounds=driver.object.globalBounds(obj),
+                visible=bool(getattr(obj, 'visible', False)),
+                enabled=bool(getattr(obj, 'enabled', False)),
+                text=None if text is None else str(text)
+            )
+
+        return self._read(_snapshot)
 
     @property
     @allure.step('Get object exists {0}')
@@ -40,7 +125,7 @@ class QObject:
     @property
     @allure.step('Get bounds {0}')
     def bounds(self):
-        return driver.object.globalBounds(self.object)
+        return self._read(driver.object.globalBounds)
 
     @property
     @allure.step('Get "x" coordinate {0}')
@@ -70,23 +155,24 @@ class QObject:
     @property
     @allure.step('Get enabled {0}')
     def is_enabled(self) -> bool:
-        return getattr(self.object, 'enabled')
+        return self._read(lambda obj: getattr(obj, 'enabled'))
 
     @property
     @allure.step('Get selected {0}')
     def is_selected(self) -> bool:
-        return getattr(self.object, 'selected')
+        return self._read(lambda obj: getattr(obj, 'selected'))
 
     @property
     @allure.step('Get checked {0}')
     def is_checked(self) -> bool:
-        return getattr(self.object, 'checked')
+        return self._read(lambda obj: getattr(obj, 'checked'))
 
     @property
     @allure.step('Get checkState {0}')
     def checkState(self) -> int:
-        if hasattr(self.object, 'checkState'):
-            return getattr(self.object, 'checkState')
+        check_state = self._read(lambda obj: getattr(obj, 'checkState', None))
+        if check_state is not None:
+            return check_state
         return 2 if self.is_checked else 0
 
     @property
@@ -97,6 +183,15 @@ class QObject:
         except (LookupError, RuntimeError, AttributeError):
             return False
 
+    @property
+    def is_shown(self) -> bool:
+        """Checks once, without waiting and without caching the handle, that the object is visible and enabled"""
+        try:
+            obj = driver.findObject(self.real_name)
+            return bool(obj.visible and getattr(obj, 'enabled', True))
+        except (LookupError, RuntimeError, AttributeError):
+            return False
+
     @property
     @allure.step('Get image {0}')
     def image(self):
@@ -111,12 +206,12 @@ class QObject:
             button=None
             # timeout=1
     ):
-        driver.mouseClick(
-            self.object,
-            x or int(self.object.width * 0.5),
-            y or int(self.object.height * 0.5),
+        self._read(lambda obj: driver.mouseClick(
+            obj,
+            x or int(obj.width * 0.5),
+            y or int(obj.height * 0.5),
             button or driver.Qt.LeftButton
-        )
+        ))
         LOG.info('%s: is clicked with Qt.LeftButton', self)
         # LOG.info("Checking if application context is frozen")
 
@@ -140,9 +235,10 @@ class QObject:
             y: typing.Union[int, driver.UiTypes.ScreenPoint] = None,
             button: driver.MouseButton = None
     ):
+        bounds = self.bounds
         driver.nativeMouseClick(
-            x or int(self.bounds.x + self.width // 2),
-            y or int(self.bounds.y + self.height // 2),
+            x or int(bounds.x + int(bounds.width) // 2),
+            y or int(bounds.y + int(bounds.height) // 2),
             button or driver.MouseButton.LeftButton
         )
         LOG.info(f'{self}: native clicked')
@@ -151,11 +247,13 @@ class QObject:
     def hover(self, timeout_msec: int = configs.timeouts.UI_LOAD_TIMEOUT_MSEC):
         def _hover():
             try:
-                driver.mouseMove(self.object)
+                obj = self.object
+                driver.mouseMove(obj)
                 LOG.info('%s: mouse hovered', self)
-                return getattr(self.object, 'hovered', True)
+                return getattr(obj, 'hovered', True)
             except RuntimeError as err:
                 LOG.error(err)
+                self.invalidate()
                 time.sleep(1)
                 return False
 
@@ -168,55 +266,44 @@ class QObject:
             x: typing.Union[int, driver.UiTypes.ScreenPoint] = None,
             y: typing.Union[int, driver.UiTypes.ScreenPoint] = None,
     ):
+        bounds = self.bounds
         self.click(
-            x or int(self.width // 2),
-            y or int(self.height // 2),
+            x or int(bounds.width) // 2,
+            y or int(bounds.height) // 2,
             driver.Qt.RightButton
         )
         LOG.info('%s: right clicked with Qt.RightButton', self)
 
-    @allure.step('Wait until appears {0}')
-    def wait_until_appears(self, timeout_msec: int = configs.timeouts.UI_LOAD_TIMEOUT_MSEC, check_interval=0.5):
-        timeout_sec = timeout_msec / 1000
-        start_time = time.time()
+    def _is_shown(self) -> bool:
+        # Resolves the object once per check, same readiness as waitForObject: visible and enabled
+        obj = driver.findObject(self.real_name)
+        if obj.visible and getattr(obj, 'enabled', True):
+            self._cache_handle(obj)
+            return True
+        return False
 
-        while time.time() - start_time < timeout_sec:
-            try:
-                if self.is_visible:
-                    LOG.info('%s: is visible', self)
-                    return self
-            except Exception as e:
-                LOG.warning("Exception during visibility check: %s", e)
-            time.sleep(check_interval)
+    def _is_hidden(self) -> bool:
+        try:
+            return not driver.findObject(self.real_name).visible
+        except (LookupError, RuntimeError, AttributeError):
+            # Object not found or has no visible attribute - consider it hidden
+            return True
 
+    @allure.step('Wait until appears {0}')
+    def wait_until_appears(self, timeout_msec: int = configs.timeouts.UI_LOAD_TIMEOUT_MSEC, check_interval=None):
+        _warn_check_interval(check_interval)
+        if wait_for_condition(self._is_shown, timeout_msec, f'{self} to appear'):
+            LOG.info('%s: is visible', self)
+            return self
         LOG.error(f'Object {self} is not visible within {timeout_msec} ms')
         raise TimeoutError(f'Object {self} is not visible within {timeout_msec} ms')
 
     @allure.step('Wait until hidden {0}')
-    def wait_until_hidden(self, timeout_msec: int =  configs.timeouts.UI_LOAD_TIMEOUT_MSEC, check_interval=0.5):
-        timeout_sec = timeout_msec / 1000
-        start_time = time.time()
-
-        while time.time() - start_time < timeout_sec:
-            try:
-                # Use short timeout for faster check when object disappears
-                obj = driver.waitForObjectExists(self.real_name, 100)
-                # Object exists, check if it's visible
-                if not obj.visible:
-                    LOG.info('%s: is hidden', self)
-                    return self
-            except (LookupError, RuntimeError):
-                # Object not found - it's hidden
-                LOG.info('%s: is hidden (not found)', self)
-                return self
-            except AttributeError:
-                # Object has no visible attribute - consider it hidden
-                LOG.info('%s: is hidden (no visible attribute)', self)
-                return self
-            except Exception as e:
-                LOG.warning("Exception during visibility check: %s", e)
-            time.sleep(check_interval)
-
+    def wait_until_hidden(self, timeout_msec: int = configs.timeouts.UI_LOAD_TIMEOUT_MSEC, check_interval=None):
+        _warn_check_interval(check_interval)
+        if wait_for_condition(self._is_hidden, timeout_msec, f'{self} to hide'):
+            LOG.info('%s: is hidden', self)
+            return self
         LOG.error(f'Timeout reached: Object {self} is not hidden within {timeout_msec} ms')
         raise TimeoutError(f'Timeout reached: Object {self} is not hidden within {timeout_msec} ms')
 
@@ -225,23 +312,21 @@ class QObject:
         return driver.waitFor(lambda: condition, timeout_msec)
 
     @allure.step('Wait until enabled {0}')
-    def wait_until_enabled(self, timeout_msec: int = 2000, check_interval=0.5):
-        timeout_sec = timeout_msec / 1000
-        start_time = time.time()
-
-        while time.time() - start_time < timeout_sec:
-            try:
-                if self.is_enabled:
-                    LOG.info('%s: is opened and enabled', self)
-                    return self
-            except Exception as e:
-                LOG.warning("Exception during visibility check: %s", e)
-            time.sleep(check_interval)
-
+    def wait_until_enabled(self, timeout_msec: int = 2000, check_interval=None):
+        _warn_check_interval(check_interval)
+        def _is_enabled():
+            return getattr(driver.findObject(self.real_name), 'enabled')
+
+        if wait_for_condition(_is_enabled, timeout_msec, f'{self} to be enabled'):
+            LOG.info('%s: is opened and enabled', self)
+            return self
         LOG.error(f'Object {self} is not enabled within {timeout_msec} ms')
         raise TimeoutError(f'Object {self} is not enabled within {timeout_msec} ms')
 
     @allure.step('Close {0}')
     def close(self):
         driver.type(self.object, '<Escape>')
-        self.wait_until_hidden()
\ No newline at end of file
+        self.wait_until_hidden()
+
+# Every input sent through the driver invalidates cached handles, also from screens calling driver directly
+driver.squish_api.interaction_listeners.append(QObject._interacted)
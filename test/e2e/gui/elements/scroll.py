@@ -24,6 +24,7 @@ class Scroll(QObject):
         started_at = time.monotonic()
         while not element.is_visible:
             driver.mouse.scroll(self.object, self.object.width / 2, self.object.height / 2, 0, -30, 1, 0.1)
+            self._interacted()
             if time.monotonic() - started_at > timeout_sec:
                 raise LookupError(f'Object not found: {element}')
 
@@ -32,6 +33,7 @@ class Scroll(QObject):
         started_at = time.monotonic()
         while not element.is_visible:
             driver.mouse.scroll(self.object, self.object.width / 2, self.object.height / 2, 0, 30, 1, 0.1)
+            self._interacted()
             if time.monotonic() - started_at > timeout_sec:
                 raise LookupError(f'Object not found: {element}')
 
@@ -40,5 +42,6 @@ class Scroll(QObject):
         started_at = time.monotonic()
         while not element.is_visible:
             driver.mouse.scroll(self.object, self.object.width / 2, self.object.height / 2, 30, 0, 1, 0.1)
+            self._interacted()
             if time.monotonic() - started_at > timeout_sec:
                 raise LookupError(f'Object not found: {element}')
@@ -33,6 +33,7 @@ class TextEdit(QObject):
     @allure.step('Clear {0}')
     def clear(self, verify: bool = True):
         self.object.clear()
+        self._interacted()
         if verify:
             assert driver.waitFor(lambda: not self.text), \
                 f'Clear text field failed, value in field: "{self.text}"'
@@ -7,7 +7,7 @@ from allure_commons._allure import step
 import configs
 import driver
 from constants import CommunityChannel
-from driver.objects_access import walk_children
+from driver.objects_access import walk_children, ObjectTreeIndex
 from gui.components.community.community_category_popup import NewCategoryPopup
 from gui.components.community.community_channel_popups import EditChannelPopup, NewChannelPopup
 from gui.components.community.invite_contacts import InviteContactsPopup
@@ -220,6 +220,7 @@ class CommunityLeftPanel(QObject):
         self.communityChatListAndCategories = QObject(communities_names.communityChatListAndCategories)
         self.channelAndCategoriesListItems = QObject(communities_names.channelAndCategoriesListItems)
         self.chatListItems = QObject(communities_names.chatListItems)
+        self._chat_list_index = ObjectTreeIndex(keys=('objectName',))
         self.chatListItemDropAreaItem = QObject(communities_names.chatListItemDropAreaItem)
         self.categoryItemDropAreaItem = QObject(communities_names.categoryListItemDropAreaItem)
 
@@ -371,9 +372,9 @@ class CommunityLeftPanel(QObject):
 
     @allure.step('Get channel or category index in the list')
     def get_channel_or_category_index(self, name: str) -> int:
-        for child in walk_children(self.chatListItems.object):
-            if child.objectName == name:
-                return child.visualIndex
+        child = self._chat_list_index.update(self.chatListItems.object).find('objectName', name)
+        if child is not None:
+            return child.visualIndex
 
     @allure.step('Right click on left panel')
     def right_click_on_panel(self):
@@ -8,7 +8,7 @@ import allure
 
 import configs
 import driver
-from driver.objects_access import walk_children
+from driver.objects_access import walk_children, ObjectTreeIndex
 from gui.components.activity_center import ActivityCenter
 from helpers.chat_helper import skip_message_backup_popup_if_visible
 from gui.components.community.pinned_messages_popup import PinnedMessagesPopup
@@ -44,15 +44,13 @@ class LeftPanel(QObject):
         self._chats_list = List(messaging_names.chatList_ListView)
         self._chat_list_item = QObject(messaging_names.scrollView_StatusChatListItem)
         self._chats_scroll = QObject(messaging_names.mainWindow_scrollView_StatusScrollView)
+        self._chats_index = ObjectTreeIndex(keys=('id',))
 
     @property
     @allure.step('Get chats by chats list')
     def get_chats_names(self) -> typing.List[str]:
-        chats_list = []
-        for child in walk_children(driver.waitForObjectExists(self._chats_list.real_name)):
-            if getattr(child, 'id', '') == 'statusChatListItem':
-                chats_list.append(str(child.objectName))
-        return chats_list
+        self._chats_index.update(driver.waitForObjectExists(self._chats_list.real_name))
+        return [str(child.objectName) for child in self._chats_index.find_all('id', 'statusChatListItem')]
 
     @allure.step('Click chat item')
     def click_chat_by_name(self, chat_name: str, attempts: int = 4):
@@ -291,8 +289,12 @@ class ChatView(QObject):
     def __init__(self):
         super().__init__(messaging_names.mainWindow_ChatColumnView)
         self._message_list_item = QObject(messaging_names.chatLogView_chatMessageViewDelegate_MessageView)
-        self._message_text_item = QObject(messaging_names.StatusTextMessage_chatTextMessage)
-        self._deleted_message = QObject(messaging_names.chatMessageViewDelegate_deletedMessage_RowLayout)
+        # QObject copies its name, children use the delegate name of this view to follow the index set on it
+        self._message_text_item = QObject({
+            **messaging_names.StatusTextMessage_chatTextMessage, 'container': self._message_list_item.real_name})
+        self._deleted_message = QObject({
+            **messaging_names.chatMessageViewDelegate_deletedMessage_RowLayout,
+            'container': self._message_list_item.real_name})
         self._recent_messages_button = QObject(messaging_names.layout_recentMessagesButton_AnchorButton)
 
     @allure.step('Get messages')
@@ -323,16 +325,26 @@ class ChatView(QObject):
     def get_deleted_message_state(self):
         return self._deleted_message.exists
 
-    def find_message_by_text(self, message_text: str, index: int):
-        message = None
+    def _find_message(self, predicate, index: int, timeout_sec: int, is_loaded=None) -> typing.Optional['Message']:
+        reader = MessageReader(self._message_list_item.real_name, index, is_loaded)
         started_at = time.monotonic()
-        while message is None:
-            for _message in self.messages(index):
-                if message_text in remove_tags(_message.text):
-                    message = _message
-                    break
-            if time.monotonic() - started_at > configs.timeouts.MESSAGING_TIMEOUT_SEC:
-                raise LookupError(f'Message not found')
+        while True:
+            if self._recent_messages_button.is_visible:
+                self._recent_messages_button.click()
+            for message, plain_text in reader.read():
+                if predicate(message, plain_text):
+                    return message
+            remaining_msec = int((timeout_sec - (time.monotonic() - started_at)) * 1000)
+            if remaining_msec <= 0:
+                return None
+            # Delegates still loading their content are read again even if no new rows show up
+            reader.wait_for_new_rows(min(remaining_msec, 1000))
+
+    def find_message_by_text(self, message_text: str, index: int):
+        message = self._find_message(
+            lambda _, plain_text: message_text in plain_text, index, configs.timeouts.MESSAGING_TIMEOUT_SEC)
+        if message is None:
+            raise LookupError(f'Message not found')
         return message
 
     @allure.step('Open community invitation')
@@ -346,18 +358,75 @@ class ChatView(QObject):
         return message.open_banned_community_invitation()
 
     def search_for_invitation(self, community, index):
-        message = None
-        started_at = time.monotonic()
-        while message is None:
-            for _message in self.messages(index):
-                if _message.community_invitation.get('name', '') == community:
-                    message = _message
-                    break
-            if time.monotonic() - started_at > 80:
-                raise LookupError(f'Community invitation was not found')
+        message = self._find_message(
+            lambda _message, _: _message.community_invitation.get('name', '') == community, index, 80,
+            # The invitation card loads after the message text, delegates without it are read again
+            is_loaded=lambda _message: bool(_message.community_invitation.get('name')))
+        if message is None:
+            raise LookupError(f'Community invitation was not found')
         return message
 
 
+class MessageReader:
+    """Reads chat log delegates incrementally.
+
+    A Message is built only for delegates that were not seen before, seen delegates are recognized by
+    their message id, text and edited/deleted state, so edits and deletions build a new Message. A seen
+    Message gets the current delegate proxy on every read. Delegates whose content is not loaded yet,
+    by default without text and invitation, are read again. Callers waiting for content that loads later,
+    like an invitation card, pass is_loaded to read delegates again until it is there. Text is stored with
+    tags already removed.
+    """
+
+    def __init__(
+            self,
+            real_name: dict,
+            index: int = None,
+            is_loaded: typing.Callable[['Message'], bool] = None
+    ):
+        self.real_name = dict(real_name)
+        if index is not None:
+            self.real_name['index'] = index
+        self._is_loaded = is_loaded or (lambda message: message.text is not None or message.community_invitation)
+        self._seen: typing.Dict[tuple, typing.Tuple[Message, str]] = {}
+        self._row_count = self._get_row_count()
+
+    @staticmethod
+    def _get_row_count() -> int:
+        try:
+            return int(driver.findObject(messaging_names.mainWindow_chatLogView_StatusListView).count)
+        except (LookupError, RuntimeError, AttributeError):
+            return -1
+
+    def read(self) -> typing.List[typing.Tuple['Message', str]]:
+        messages = []
+        for item in driver.findAllObjects(self.real_name):
+            if not getattr(item, 'isMessage', True):
+                continue
+            key = (
+                str(getattr(item, 'messageId', '')),
+                str(getattr(item, 'messageText', '')),
+                bool(getattr(item, 'isEdited', False)),
+                bool(getattr(item, 'deleted', False)),
+            )
+            if key in self._seen:
+                message, plain_text = self._seen[key]
+                message.object = item
+            else:
+                message = Message(item)
+                plain_text = remove_tags(message.text or '')
+                if self._is_loaded(message):
+                    self._seen[key] = (message, plain_text)
+            messages.append((message, plain_text))
+        return messages
+
+    def wait_for_new_rows(self, timeout_msec: int) -> bool:
+        row_count = self._row_count
+        changed = driver.waitFor(lambda: self._get_row_count() != row_count, timeout_msec)
+        self._row_count = self._get_row_count()
+        return changed
+
+
 class CreateChatView(QObject):
 
     def __init__(self):
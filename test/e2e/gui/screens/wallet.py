@@ -9,7 +9,7 @@ import configs
 import constants
 import driver
 from constants import WalletAccount
-from driver.objects_access import walk_children
+from driver.objects_access import walk_children, ObjectTreeIndex
 from gui.components.context_menu import ContextMenu
 from gui.components.wallet.add_saved_address_popup import AddEditSavedAddressPopup
 from gui.components.wallet.asset_context_menu_popup import AssetContextMenuPopup
@@ -179,6 +179,7 @@ class SavedAddressesView(QObject):
         self._address_list_item = QObject(wallet_names.savedAddressView_Delegate)
         self._addresses_area = QObject(wallet_names.savedAddresses_area)
         self._addresses_list_view = QObject(wallet_names.mainWallet_Saved_Addresses_List)
+        self._addresses_index = ObjectTreeIndex(keys=('id',))
         self._send_button = Button(wallet_names.send_StatusRoundButton)
         self._open_menu_button = Button(wallet_names.savedAddressView_Delegate_menuButton)
         self._saved_address_item = QObject(wallet_names.savedAddressView_Delegate)
@@ -186,11 +187,8 @@ class SavedAddressesView(QObject):
     @property
     @allure.step('Get saved addresses wallet_names')
     def address_names(self):
-        address_names = []
-        for child in walk_children(self._addresses_list_view.object):
-            if getattr(child, 'id', '') == 'savedAddressDelegate':
-                address_names.append(str(child.name))
-        return address_names
+        self._addresses_index.update(self._addresses_list_view.object)
+        return [str(child.name) for child in self._addresses_index.find_all('id', 'savedAddressDelegate')]
 
     @allure.step('Get saved addresses list')
     def get_saved_addresses_list(self):
@@ -268,32 +266,6 @@ class WalletAccountView(QObject):
         self.footer_swap_button.click()
         return SwapPopup()
 
-    @allure.step('Click Swap button and record load time until SwapPopup is visible')
-    def open_swap_popup_and_record_load_time(self, timeout_msec: int = configs.timeouts.UI_LOAD_TIMEOUT_MSEC):
-        start_time = time.time()
-        self.footer_swap_button.click()
-        swap_popup = SwapPopup()
-        check_interval = 0.1  # Check every 100ms for better precision
-        timeout_sec = timeout_msec / 1000
-
-        while time.time() - start_time < timeout_sec:
-            try:
-                if swap_popup.is_visible:
-                    LOG.info('SwapPopup: is visible')
-                    break
-            except Exception as e:
-                LOG.debug("Exception during visibility check: %s", e)
-            time.sleep(check_interval)
-        else:
-            # Timeout reached
-            load_time = time.time() - start_time
-            LOG.error(f'SwapPopup is not visible within {timeout_msec} ms (waited {load_time:.3f} seconds)')
-            raise TimeoutError(f'SwapPopup is not visible within {timeout_msec} ms')
-
-        load_time = time.time() - start_time
-        LOG.info(f'SwapPopup loaded in {load_time:.3f} seconds')
-        return swap_popup, load_time
-
     @allure.step('Open send popup')
     def open_send_popup(self) -> SendPopup:
         self._send_button.click()
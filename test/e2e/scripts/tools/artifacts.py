@@ -0,0 +1,111 @@
+import logging
+import threading
+import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import allure
+import cv2
+import numpy as np
+
+from scripts.utils.system_path import SystemPath
+
+LOG = logging.getLogger(__name__)
+
+
+class ArtifactWriter:
+    """Encodes and writes test artifacts in background threads.
+
+    Attachments are added to allure by flush() on the test thread, because allure binds attachments to the
+    test running in the calling thread. The queue is bounded, submitting blocks while it is full. Written
+    artifacts wait for flush() up to max_pending, older ones are then attached by the submitting thread.
+    After close() artifacts are written and attached synchronously, e.g. screenshots of session teardown failures.
+    """
+
+    def __init__(self, workers: int = 2, queue_size: int = 16, max_pending: int = 64):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='artifacts')
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._max_pending = max_pending
+        self._pending: typing.List[Future] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _run_now(self, fn, *args) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as err:
+            future.set_exception(err)
+        self._attach(future)
+        return future
+
+    def _submit(self, fn, *args) -> Future:
+        if self._closed:
+            return self._run_now(fn, *args)
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, *args)
+        except RuntimeError:
+            # The executor was shut down by close() in another thread
+            self._slots.release()
+            return self._run_now(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        with self._lock:
+            self._pending.append(future)
+            overflow = self._pending[:-self._max_pending]
+            del self._pending[:-self._max_pending]
+        for pending in overflow:
+            self._attach(pending)
+        return future
+
+    @staticmethod
+    def _write_image(view: np.ndarray, fp: typing.Optional[SystemPath], attach_name: typing.Optional[str]):
+        body = cv2.imencode('.png', view)[1].tobytes()
+        if fp is not None:
+            fp.parent.mkdir(parents=True, exist_ok=True)
+            fp.write_bytes(body)
+        return attach_name, body, allure.attachment_type.PNG
+
+    @staticmethod
+    def _read_file(fp: SystemPath, attach_name: str, attachment_type, unlink: bool):
+        body = fp.read_bytes()
+        if unlink:
+            try:
+                fp.unlink()
+            except OSError as err:
+                # Windows does not allow to delete a file the application still has open
+                LOG.info(f'Unable to delete {fp}: {err}')
+        return attach_name, body, attachment_type
+
+    def save_image(self, view: np.ndarray, fp: SystemPath = None, attach_name: str = None) -> Future:
+        # Copy, the caller may change the view while it is encoded
+        return self._submit(self._write_image, np.array(view), fp, attach_name)
+
+    def attach_file(self, fp: SystemPath, attach_name: str, attachment_type, unlink: bool = False) -> Future:
+        return self._submit(self._read_file, fp, attach_name, attachment_type, unlink)
+
+    @staticmethod
+    def _attach(future: Future):
+        try:
+            attach_name, body, attachment_type = future.result()
+        except Exception as err:
+            LOG.error(f'Failed to write artifact: {err}')
+            return
+        if attach_name is not None:
+            allure.attach(body, name=attach_name, attachment_type=attachment_type)
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            self._attach(future)
+
+    def close(self):
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        self.flush()
+
+
+artifacts = ArtifactWriter()
@@ -0,0 +1,124 @@
+import json
+import logging
+import math
+import time
+import typing
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+
+import allure
+
+import configs
+from gui.elements.object import QObject
+from scripts.utils.system_path import SystemPath
+
+LOG = logging.getLogger(__name__)
+
+
+def _percentile(samples: typing.List[float], percent: float) -> float:
+    # Nearest rank, the result is always one of the measured samples
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+@dataclass
+class TransitionTimings:
+    name: str
+    samples_msec: typing.List[float] = field(default_factory=list)
+    warmup: int = 0
+    metadata: dict = field(default_factory=dict)
+
+    @property
+    def p50(self) -> float:
+        return _percentile(self.samples_msec, 50)
+
+    @property
+    def p95(self) -> float:
+        return _percentile(self.samples_msec, 95)
+
+    @property
+    def max(self) -> float:
+        return max(self.samples_msec)
+
+    def to_dict(self) -> dict:
+        return {
+            **asdict(self),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'p50_msec': self.p50,
+            'p95_msec': self.p95,
+            'max_msec': self.max,
+        }
+
+    def __str__(self):
+        return (f'{self.name}: p50 {self.p50:.1f} ms, p95 {self.p95:.1f} ms, max {self.max:.1f} ms '
+                f'over {len(self.samples_msec)} runs')
+
+
+def measure_transition(
+        button: QObject, target: QObject, timeout_msec: int = configs.timeouts.UI_LOAD_TIMEOUT_MSEC) -> float:
+    """Clicks the button and returns milliseconds until the target is visible and enabled.
+
+    The target is checked again right after every check, without a sleep, so the resolution is one round
+    trip to the AUT. squish.waitFor is not used, its polling interval is not under control of the script.
+    """
+    started_at = time.perf_counter()
+    deadline = started_at + timeout_msec / 1000
+    button.click()
+    while not target.is_shown:
+        if time.perf_counter() >= deadline:
+            raise TimeoutError(f'{target} is not visible within {timeout_msec} ms')
+    return (time.perf_counter() - started_at) * 1000
+
+
+class ScreenTransitionBenchmark:
+    """Measures the time between a click on a button and the target screen becoming visible.
+
+    "leave" is called after every run to return to a state where the target screen is not shown, the next
+    run starts once the target is hidden. Warmup runs are measured the same way but not recorded.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            button: QObject,
+            target: QObject,
+            leave: typing.Callable[[], typing.Any],
+            warmup: int = configs.BENCHMARK_WARMUP,
+            iterations: int = configs.BENCHMARK_ITERATIONS,
+            timeout_msec: int = configs.timeouts.UI_LOAD_TIMEOUT_MSEC
+    ):
+        self.name = name
+        self.button = button
+        self.target = target
+        self.leave = leave
+        self.warmup = warmup
+        self.iterations = iterations
+        self.timeout_msec = timeout_msec
+
+    @allure.step('Measure {0.name} load time')
+    def run(self, metadata: dict = None) -> TransitionTimings:
+        timings = TransitionTimings(self.name, warmup=self.warmup, metadata=metadata or {})
+        for i in range(self.warmup + self.iterations):
+            load_time = measure_transition(self.button, self.target, self.timeout_msec)
+            if i < self.warmup:
+                LOG.info('%s warmup load time: %.1f ms', self.name, load_time)
+            else:
+                timings.samples_msec.append(load_time)
+                LOG.info('[%d/%d] %s load time: %.1f ms',
+                         i - self.warmup + 1, self.iterations, self.name, load_time)
+            self.leave()
+            self.target.wait_until_hidden(self.timeout_msec)
+        LOG.info(timings)
+        return timings
+
+
+def record(timings: TransitionTimings, results_file: SystemPath = None):
+    """Appends timings as a JSON line to the results file of the run and attaches them to allure"""
+    results_file = results_file or configs.testpath.RUN / 'screen_timings.jsonl'
+    line = json.dumps(timings.to_dict())
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    # A single write of a short line in append mode is not interleaved with lines of other xdist workers
+    with open(results_file, 'a', encoding='utf-8') as file:
+        file.write(line + '\n')
+    allure.attach(str(timings), name=f'{timings.name} load time', attachment_type=allure.attachment_type.TEXT)
+    allure.attach(line, name=f'{timings.name} load time (json)', attachment_type=allure.attachment_type.JSON)
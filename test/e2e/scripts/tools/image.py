@@ -6,19 +6,93 @@ from datetime import datetime
 import allure
 import cv2
 import numpy as np
-import pytesseract
 from PIL import ImageGrab
 
 import configs
 import constants
 import driver
 from configs.system import get_platform
+from gui.objects_map.names import statusDesktop_mainWindow
+from scripts.tools.artifacts import artifacts
+from scripts.tools.ocr import Ocr
 from scripts.tools.ocv import Ocv
 from scripts.utils.system_path import SystemPath
 
+try:
+    import mss
+except ImportError:
+    mss = None
+
 LOG = logging.getLogger(__name__)
 
 
+class FrameCapture:
+    """Grabs the main window once per UI tick and serves object regions as views of that frame.
+
+    A frame is reused until FRAME_CAPTURE_TTL_MSEC passes or invalidate() is called on interaction.
+    On Linux the frame is grabbed through MIT-SHM with "mss" if it is installed.
+    """
+
+    def __init__(self):
+        self._frame: typing.Optional[np.ndarray] = None
+        self._origin = (0, 0)
+        self._captured_at = 0.0
+        self._grabber = None
+        self._grabber_display = None
+
+    def invalidate(self):
+        self._frame = None
+
+    def _grab(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        if mss is not None and get_platform() == "Linux":
+            if self._grabber is None or self._grabber_display != configs.system.DISPLAY:
+                if self._grabber is not None:
+                    self._grabber.close()
+                self._grabber = mss.mss(display=configs.system.DISPLAY)
+                self._grabber_display = configs.system.DISPLAY
+            shot = self._grabber.grab({'left': x, 'top': y, 'width': width, 'height': height})
+            return cv2.cvtColor(np.asarray(shot), cv2.COLOR_BGRA2BGR)
+        img = ImageGrab.grab(
+            bbox=(x, y, x + width, y + height),
+            xdisplay=configs.system.DISPLAY if get_platform() == "Linux" else None
+        )
+        return cv2.cvtColor(np.array(img), cv2.COLOR_BGR2RGB)
+
+    def _is_fresh(self) -> bool:
+        return (
+                self._frame is not None and
+                time.monotonic() - self._captured_at < configs.timeouts.FRAME_CAPTURE_TTL_MSEC / 1000
+        )
+
+    def _contains(self, x: int, y: int, width: int, height: int) -> bool:
+        left, top = self._origin
+        return (
+                left <= x and top <= y and
+                x + width <= left + self._frame.shape[1] and y + height <= top + self._frame.shape[0]
+        )
+
+    def capture(self):
+        rect = driver.object.globalBounds(driver.waitForObject(statusDesktop_mainWindow))
+        self._frame = self._grab(int(rect.x), int(rect.y), int(rect.width), int(rect.height))
+        # Regions are served as views, protect the shared frame from in place changes
+        self._frame.flags.writeable = False
+        self._origin = (int(rect.x), int(rect.y))
+        self._captured_at = time.monotonic()
+
+    def grab(self, rect: driver.UiTypes.ScreenRectangle) -> np.ndarray:
+        x, y, width, height = int(rect.x), int(rect.y), int(rect.width), int(rect.height)
+        if not self._is_fresh():
+            self.capture()
+        if not self._contains(x, y, width, height):
+            LOG.debug('Region is outside of the main window, grabbing it separately')
+            return self._grab(x, y, width, height)
+        left, top = self._origin
+        return self._frame[y - top: y - top + height, x - left: x - left + width]
+
+
+frame_capture = FrameCapture()
+
+
 class Image:
 
     def __init__(self, object_name: dict):
@@ -55,11 +129,7 @@ class Image:
     def update_view(self):
         LOG.debug(f'Image view was grab from: {self.object_name}')
         rect = driver.object.globalBounds(driver.waitForObject(self.object_name))
-        img = ImageGrab.grab(
-            bbox=(rect.x, rect.y, rect.x + rect.width, rect.y + rect.height),
-            xdisplay=configs.system.DISPLAY if get_platform() == "Linux" else None
-        )
-        self._view = cv2.cvtColor(np.array(img), cv2.COLOR_BGR2RGB)
+        self._view = frame_capture.grab(rect)
 
     @allure.step('Save image')
     def save(self, path: SystemPath, force: bool = False):
@@ -82,20 +152,11 @@ class Image:
         if result:
             LOG.info(f'Screenshot comparison passed')
         else:
-            configs.testpath.TEST_ARTIFACTS.mkdir(parents=True, exist_ok=True)
             diff = Ocv.draw_contours(self.view, expected)
 
-            actual_fp = configs.testpath.TEST_ARTIFACTS / f'actual_image.png'
-            expected_fp = configs.testpath.TEST_ARTIFACTS / f'expected_image.png'
-            diff_fp = configs.testpath.TEST_ARTIFACTS / f'diff_image.png'
-
-            self.save(actual_fp, force=True)
-            cv2.imwrite(str(expected_fp), expected)
-            cv2.imwrite(str(diff_fp), diff)
-
-            allure.attach(name='actual', body=actual_fp.read_bytes(), attachment_type=allure.attachment_type.PNG)
-            allure.attach(name='expected', body=expected_fp.read_bytes(), attachment_type=allure.attachment_type.PNG)
-            allure.attach(name='diff', body=diff_fp.read_bytes(), attachment_type=allure.attachment_type.PNG)
+            artifacts.save_image(self.view, configs.testpath.TEST_ARTIFACTS / f'actual_image.png', 'actual')
+            artifacts.save_image(expected, configs.testpath.TEST_ARTIFACTS / f'expected_image.png', 'expected')
+            artifacts.save_image(diff, configs.testpath.TEST_ARTIFACTS / f'diff_image.png', 'diff')
 
             LOG.info(
                 f"Screenshot comparison failed.\n"
@@ -111,7 +172,7 @@ class Image:
 
     @allure.step('Parse text on image')
     def to_string(self, custom_config: str):
-        text: str = pytesseract.image_to_string(self.view, config=custom_config)
+        text: str = Ocr.image_to_string(self.view, config=custom_config)
         LOG.debug(f'Text on image: {text}')
         return text
 
@@ -124,64 +185,88 @@ class Image:
         # Search text on image converted in gray color
         self.set_grayscale()
         fp_gray = configs.testpath.TEST_ARTIFACTS / f'search_region_in_gray_color.png'
-        self.save(fp_gray, force=True)
         if text.lower() in self.to_string(criteria).lower():
-            allure.attach(name='search_region', body=fp_gray.read_bytes(), attachment_type=allure.attachment_type.PNG)
+            artifacts.save_image(self.view, fp_gray, 'search_region')
             return True
+        artifacts.save_image(self.view, fp_gray)
 
         # Search text on image with inverted color
         self._view = cv2.bitwise_not(self.view)
         fp_invert = configs.testpath.TEST_ARTIFACTS / f'search_region_in_inverted_color.png'
-        self.save(fp_invert, force=True)
         if text.lower() in self.to_string(criteria).lower():
-            allure.attach(name='search_region', body=fp_invert.read_bytes(), attachment_type=allure.attachment_type.PNG)
+            artifacts.save_image(self.view, fp_invert, 'search_region')
             return True
+        artifacts.save_image(self.view, fp_invert)
         return False
 
     @allure.step('Search color on image')
     def has_color(self, color: constants.Color, denoise: int = 10, crop: driver.UiTypes.ScreenRectangle = None) -> bool:
+        return self.has_colors([color], denoise, crop)[color]
+
+    @allure.step('Search colors on image')
+    def has_colors(
+            self,
+            colors: typing.Iterable[constants.Color],
+            denoise: int = 10,
+            crop: driver.UiTypes.ScreenRectangle = None
+    ) -> typing.Dict[constants.Color, bool]:
         self.update_view()
         if crop:
             self.crop(crop)
 
-        initial_view = configs.testpath.TEST_ARTIFACTS / f'{color.name}.png'
-        self.save(initial_view)
-        allure.attach(name='search_region', body=initial_view.read_bytes(), attachment_type=allure.attachment_type.PNG)
-
-        contours = self._get_color_contours(color, denoise, apply=True)
-
-        mask_view = configs.testpath.TEST_ARTIFACTS / f'{color.name}_mask.png'
-        self.save(mask_view)
-        allure.attach(name='contours', body=mask_view.read_bytes(), attachment_type=allure.attachment_type.PNG)
+        search_region = self.view
+        masks = self._get_color_masks(colors)
+        result = {}
+        for color, mask in masks.items():
+            contours = self._find_contours(mask, denoise)
+            result[color] = len(contours) >= 1
+            # Artifacts are only needed to investigate failures
+            if not result[color] or configs.SAVE_IMAGE_ARTIFACTS:
+                self._view = search_region
+                self._attach_view(f'{color.name}.png', 'search_region')
+                self._apply_contours(mask, contours)
+                self._attach_view(f'{color.name}_mask.png', 'contours')
 
         self._view = None
-        return len(contours) >= 1
-
-    @allure.step('Apply contours with found color on image')
-    def _get_color_contours(
-            self,
-            color: constants.Color,
-            denoise: int = 10,
-            apply: bool = False
-    ) -> typing.List[driver.UiTypes.ScreenRectangle]:
-        if not self.is_grayscale:
-            view = cv2.cvtColor(self.view, cv2.COLOR_BGR2HSV)
-        else:
-            view = self.view
-        boundaries = constants.boundaries[color]
-
-        if color == constants.Color.RED:
-            mask = None
-            for bond in boundaries:
-                lower_range = np.array(bond[0])
-                upper_range = np.array(bond[1])
-                _mask = cv2.inRange(view, lower_range, upper_range)
-                mask = _mask if mask is None else mask + _mask
-        else:
-            lower_range = np.array(boundaries[0])
-            upper_range = np.array(boundaries[1])
-            mask = cv2.inRange(view, lower_range, upper_range)
+        return result
 
+    def _attach_view(self, file_name: str, name: str):
+        artifacts.save_image(self.view, configs.testpath.TEST_ARTIFACTS / file_name, name)
+
+    @staticmethod
+    def _get_color_luts(
+            colors: typing.List[constants.Color]
+    ) -> typing.Tuple[typing.List[np.ndarray], typing.Dict[constants.Color, int]]:
+        # Every boundary gets a bit, a channel lookup table tells which boundaries contain the channel value
+        luts = [np.zeros(256, dtype=np.uint16) for _ in range(3)]
+        color_bits = {}
+        bit = 0
+        for color in colors:
+            boundaries = constants.boundaries[color]
+            if color == constants.Color.RED:
+                bounds = boundaries
+            else:
+                bounds = [boundaries]
+            color_bits[color] = 0
+            for lower_range, upper_range in bounds:
+                for channel, lut in enumerate(luts):
+                    lut[lower_range[channel]: upper_range[channel] + 1] |= 1 << bit
+                color_bits[color] |= 1 << bit
+                bit += 1
+        assert bit <= 16, 'Too many color boundaries to search in one pass'
+        return luts, color_bits
+
+    def _get_color_masks(self, colors: typing.Iterable[constants.Color]) -> typing.Dict[constants.Color, np.ndarray]:
+        view = self.view
+        if self.is_grayscale:
+            view = cv2.cvtColor(view, cv2.COLOR_GRAY2BGR)
+        hsv = cv2.cvtColor(view, cv2.COLOR_BGR2HSV)
+        luts, color_bits = self._get_color_luts(list(colors))
+        matches = luts[0][hsv[..., 0]] & luts[1][hsv[..., 1]] & luts[2][hsv[..., 2]]
+        return {color: np.where(matches & bits, 255, 0).astype(np.uint8) for color, bits in color_bits.items()}
+
+    @staticmethod
+    def _find_contours(mask: np.ndarray, denoise: int = 10) -> typing.List[driver.UiTypes.ScreenRectangle]:
         contours = []
         _contours = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         _contours = _contours[0] if len(_contours) == 2 else _contours[1]
@@ -191,19 +276,44 @@ class Image:
             if w * h < denoise:
                 continue
             contours.append(driver.UiTypes.ScreenRectangle(x, y, w, h))
+        return contours
 
-        if apply:
-            self._view = cv2.bitwise_and(self.view, self.view, mask=mask)
-            for contour in contours:
-                cv2.rectangle(
-                    self.view,
-                    (contour.x, contour.y),
-                    (contour.x + contour.width, contour.y + contour.height),
-                    (36, 255, 12), 2)
+    def _apply_contours(self, mask: np.ndarray, contours: typing.List[driver.UiTypes.ScreenRectangle]):
+        self._view = cv2.bitwise_and(self.view, self.view, mask=mask)
+        for contour in contours:
+            cv2.rectangle(
+                self.view,
+                (contour.x, contour.y),
+                (contour.x + contour.width, contour.y + contour.height),
+                (36, 255, 12), 2)
 
+    @allure.step('Apply contours with found color on image')
+    def _get_color_contours(
+            self,
+            color: constants.Color,
+            denoise: int = 10,
+            apply: bool = False
+    ) -> typing.List[driver.UiTypes.ScreenRectangle]:
+        mask = self._get_color_masks([color])[color]
+        contours = self._find_contours(mask, denoise)
+        if apply:
+            self._apply_contours(mask, contours)
         return contours
 
 
+_expected_images: typing.Dict[tuple, np.ndarray] = {}
+
+
+def _read_expected(fp: SystemPath) -> np.ndarray:
+    # Verification points are read once per session, Ocv keeps their pyramids by content
+    key = (str(fp), fp.stat().st_mtime_ns)
+    if key not in _expected_images:
+        view = cv2.imread(str(fp))
+        view.flags.writeable = False
+        _expected_images[key] = view
+    return _expected_images[key]
+
+
 @allure.step('Compare images')
 def compare(actual: Image,
             expected: typing.Union[str, SystemPath, Image],
@@ -218,7 +328,7 @@ def compare(actual: Image,
         expected = expected_fp
     if isinstance(expected, SystemPath):
         assert expected.exists(), f'File: {expected} not found'
-        expected = cv2.imread(str(expected))
+        expected = _read_expected(expected)
     else:
         expected = expected.view
     start = datetime.now()
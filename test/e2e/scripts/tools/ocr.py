@@ -0,0 +1,89 @@
+import collections
+import hashlib
+import logging
+import shlex
+import typing
+
+import numpy as np
+import pytesseract
+from PIL import Image as PILImage
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+LOG = logging.getLogger(__name__)
+
+
+class Ocr:
+    """Recognizes text with a long-lived Tesseract API and memoizes results by image hash and config.
+
+    The API is provided by "tesserocr" bindings if they are installed, otherwise every new image is passed
+    to the tesseract process through pytesseract. There is one API per language, engine mode and set of
+    variables, so variables of one config never apply to another one.
+    """
+    cache_size = 256
+    _apis: typing.Dict[tuple, typing.Any] = {}
+    _cache: typing.OrderedDict[tuple, str] = collections.OrderedDict()
+
+    @classmethod
+    def _parse_config(cls, config: str) -> typing.Tuple[str, int, typing.Optional[int], typing.Dict[str, str]]:
+        lang, oem, psm, variables = 'eng', 3, None, {}
+        args = shlex.split(config)
+        for index, arg in enumerate(args):
+            value = args[index + 1] if index + 1 < len(args) else None
+            if arg in ('-l', '--lang'):
+                lang = value
+            elif arg == '--oem':
+                oem = int(value)
+            elif arg == '--psm':
+                psm = int(value)
+            elif arg == '-c' and value and '=' in value:
+                key, _, variable = value.partition('=')
+                variables[key] = variable
+        return lang, oem, psm, variables
+
+    @classmethod
+    def _get_api(cls, lang: str, oem: int, variables: typing.Dict[str, str]):
+        key = (lang, oem, tuple(sorted(variables.items())))
+        api = cls._apis.get(key)
+        if api is None:
+            LOG.debug('Starting Tesseract API: lang=%s, oem=%d, variables=%s', lang, oem, variables)
+            # tesserocr.OEM and tesserocr.PSM are namespaces of int constants and can not be called
+            api = tesserocr.PyTessBaseAPI(lang=lang, oem=oem)
+            for name, value in variables.items():
+                api.SetVariable(name, value)
+            cls._apis[key] = api
+        return api
+
+    @classmethod
+    def _recognize(cls, view: np.ndarray, config: str) -> str:
+        if tesserocr is None:
+            return pytesseract.image_to_string(view, config=config)
+        lang, oem, psm, variables = cls._parse_config(config)
+        api = cls._get_api(lang, oem, variables)
+        api.Clear()
+        api.SetPageSegMode(tesserocr.PSM.AUTO if psm is None else psm)
+        api.SetImage(PILImage.fromarray(view))
+        return api.GetUTF8Text()
+
+    @classmethod
+    def image_to_string(cls, view: np.ndarray, config: str = '') -> str:
+        key = (hashlib.blake2b(np.ascontiguousarray(view).data, digest_size=16).hexdigest(), view.shape, config)
+        text = cls._cache.get(key)
+        if text is not None:
+            cls._cache.move_to_end(key)
+            return text
+        text = cls._recognize(view, config)
+        cls._cache[key] = text
+        if len(cls._cache) > cls.cache_size:
+            cls._cache.popitem(last=False)
+        return text
+
+    @classmethod
+    def close(cls):
+        for api in cls._apis.values():
+            api.End()
+        cls._apis.clear()
+        cls._cache.clear()
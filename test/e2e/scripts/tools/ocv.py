@@ -1,27 +1,104 @@
+import hashlib
+import typing
+
 import cv2
 import numpy as np
 
 
 class Ocv:
+    # Coarse search is used while the template stays at least this size on the smallest pyramid level
+    min_template_size = 16
+    max_pyramid_levels = 3
+    _pyramids: typing.Dict[str, typing.List[np.ndarray]] = {}
+    _contours: typing.Dict[str, tuple] = {}
+
+    @staticmethod
+    def _hash(view: np.ndarray) -> str:
+        return hashlib.blake2b(np.ascontiguousarray(view).data, digest_size=16).hexdigest() + str(view.shape)
+
+    @staticmethod
+    def _to_gray(view: np.ndarray) -> np.ndarray:
+        if view.ndim == 2:
+            return view
+        return cv2.cvtColor(view, cv2.COLOR_BGRA2GRAY if view.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+
+    @classmethod
+    def _build_pyramid(cls, view: np.ndarray, levels: int) -> typing.List[np.ndarray]:
+        pyramid = [cls._to_gray(view)]
+        for _ in range(levels):
+            pyramid.append(cv2.pyrDown(pyramid[-1]))
+        return pyramid
+
+    @classmethod
+    def _get_pyramid(cls, view: np.ndarray, levels: int, cache: bool = False) -> typing.List[np.ndarray]:
+        if not cache:
+            return cls._build_pyramid(view, levels)
+        key = cls._hash(view)
+        pyramid = cls._pyramids.get(key)
+        if pyramid is None or len(pyramid) <= levels:
+            pyramid = cls._build_pyramid(view, levels)
+            cls._pyramids[key] = pyramid
+        return pyramid
+
+    @classmethod
+    def _get_levels(cls, lhd: np.ndarray, rhd: np.ndarray) -> int:
+        levels = 0
+        while (
+                levels < cls.max_pyramid_levels and
+                min(rhd.shape[:2]) >> (levels + 1) >= cls.min_template_size and
+                # Searching makes sense only if the image is bigger than the template
+                max(lhd.shape[0] - rhd.shape[0], lhd.shape[1] - rhd.shape[1]) >> levels > 1
+        ):
+            levels += 1
+        return levels
 
     @classmethod
     def compare_images(cls, lhd: np.ndarray, rhd: np.ndarray) -> float:
-        res = cv2.matchTemplate(lhd, rhd, cv2.TM_CCOEFF_NORMED)
+        """Returns the best TM_CCOEFF_NORMED correlation of template rhd in image lhd.
+
+        The location is found on downsampled grayscale pyramids of both images (pyramids of rhd, the expected
+        image, are kept for the session), then the correlation is computed in full resolution around it only.
+        """
+        if lhd.shape == rhd.shape and np.array_equal(lhd, rhd):
+            return 1.0
+
+        levels = cls._get_levels(lhd, rhd)
+        if not levels:
+            res = cv2.matchTemplate(lhd, rhd, cv2.TM_CCOEFF_NORMED)
+            _, correlation, _, _ = cv2.minMaxLoc(res)
+            return correlation
+
+        lhd_pyramid = cls._get_pyramid(lhd, levels)
+        rhd_pyramid = cls._get_pyramid(rhd, levels, cache=True)
+        res = cv2.matchTemplate(lhd_pyramid[levels], rhd_pyramid[levels], cv2.TM_CCOEFF_NORMED)
+        _, _, _, (x, y) = cv2.minMaxLoc(res)
+
+        scale = 1 << levels
+        margin = scale * 2
+        height, width = rhd.shape[:2]
+        top = max(0, y * scale - margin)
+        left = max(0, x * scale - margin)
+        bottom = min(lhd.shape[0], y * scale + height + margin)
+        right = min(lhd.shape[1], x * scale + width + margin)
+        res = cv2.matchTemplate(lhd[top:bottom, left:right], rhd, cv2.TM_CCOEFF_NORMED)
         _, correlation, _, _ = cv2.minMaxLoc(res)
         return correlation
 
     @classmethod
-    def draw_contours(cls, lhd: np.ndarray, rhd: np.ndarray) -> np.ndarray:
-        view = rhd.copy()
-
-        lhd = cv2.cvtColor(lhd, cv2.COLOR_BGRA2GRAY)
-        _, thresh = cv2.threshold(lhd, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+    def _get_otsu_contours(cls, view: np.ndarray, cache: bool = False) -> tuple:
+        key = cls._hash(view) if cache else None
+        if key in cls._contours:
+            return cls._contours[key]
+        gray = cv2.cvtColor(view, cv2.COLOR_BGRA2GRAY)
+        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
         contours, hierarchy = cv2.findContours(thresh, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-        cv2.drawContours(view, contours, -1, (0, 0, 255), 1)
-
-        rhd = cv2.cvtColor(rhd, cv2.COLOR_BGRA2GRAY)
-        _, thresh = cv2.threshold(rhd, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
-        contours, hierarchy = cv2.findContours(thresh, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
-        cv2.drawContours(view, contours, -1, (0, 255, 0), 1)
+        if cache:
+            cls._contours[key] = contours
+        return contours
 
+    @classmethod
+    def draw_contours(cls, lhd: np.ndarray, rhd: np.ndarray) -> np.ndarray:
+        view = rhd.copy()
+        cv2.drawContours(view, cls._get_otsu_contours(lhd), -1, (0, 0, 255), 1)
+        cv2.drawContours(view, cls._get_otsu_contours(rhd, cache=True), -1, (0, 255, 0), 1)
         return view
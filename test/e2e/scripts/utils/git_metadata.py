@@ -0,0 +1,82 @@
+import logging
+import pathlib
+import sys
+import typing
+
+from configs.system import get_platform
+
+LOG = logging.getLogger(__name__)
+
+_MAX_SYMREF_DEPTH = 5
+
+
+def _get_git_dir(repo: pathlib.Path) -> typing.Optional[pathlib.Path]:
+    dot_git = repo / '.git'
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        # Submodules and worktrees have a ".git" file with "gitdir: <path>"
+        content = dot_git.read_text().strip()
+        if content.startswith('gitdir:'):
+            git_dir = pathlib.Path(content[len('gitdir:'):].strip())
+            return git_dir if git_dir.is_absolute() else (repo / git_dir).resolve()
+    return None
+
+
+def _get_common_dir(git_dir: pathlib.Path) -> pathlib.Path:
+    # Worktrees keep HEAD in their own git dir but share refs with the main one
+    commondir = git_dir / 'commondir'
+    if commondir.is_file():
+        return (git_dir / commondir.read_text().strip()).resolve()
+    return git_dir
+
+
+def _read_packed_ref(common_dir: pathlib.Path, ref: str) -> typing.Optional[str]:
+    packed_refs = common_dir / 'packed-refs'
+    if not packed_refs.is_file():
+        return None
+    for line in packed_refs.read_text().splitlines():
+        # Skip the header and peeled tag lines
+        if not line or line.startswith(('#', '^')):
+            continue
+        commit, _, name = line.partition(' ')
+        if name.strip() == ref:
+            return commit
+    return None
+
+
+def _resolve(git_dir: pathlib.Path, common_dir: pathlib.Path, ref: str) -> typing.Optional[str]:
+    for _ in range(_MAX_SYMREF_DEPTH):
+        for base in (git_dir, common_dir):
+            ref_file = base / ref
+            if ref_file.is_file():
+                value = ref_file.read_text().strip()
+                break
+        else:
+            return _read_packed_ref(common_dir, ref)
+        if not value.startswith('ref:'):
+            return value
+        ref = value[len('ref:'):].strip()
+    return None
+
+
+def get_head_commit(repo: pathlib.Path) -> typing.Optional[str]:
+    """Reads the HEAD commit hash of a repository directly from its git dir, without running git"""
+    try:
+        git_dir = _get_git_dir(pathlib.Path(repo))
+        if git_dir is None:
+            return None
+        return _resolve(git_dir, _get_common_dir(git_dir), 'HEAD')
+    except OSError as e:
+        LOG.debug(f'Could not read git commit of {repo}: {e}')
+        return None
+
+
+def get_run_metadata(app_repo: pathlib.Path) -> typing.Dict[str, typing.Optional[str]]:
+    """Metadata of a test run, the values are plain strings so that it can be sent to xdist workers"""
+    return {
+        'os_platform': get_platform(),
+        'python_version': f'Python {sys.version_info.major}.{sys.version_info.minor}',
+        'app_commit': get_head_commit(app_repo),
+        'status_go_commit': get_head_commit(pathlib.Path(app_repo) / 'vendor' / 'status-go'),
+    }
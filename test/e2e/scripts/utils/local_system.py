@@ -1,7 +1,10 @@
 import logging
 import os
+import select
 import signal
+import socket
 import subprocess
+import threading
 import typing
 
 import allure
@@ -12,6 +15,14 @@ from configs.system import get_platform
 
 LOG = logging.getLogger(__name__)
 
+# Ports handed out by find_free_port that are not released yet, the process may not be listening on them yet
+_reserved_ports: typing.Set[int] = set()
+_ports_lock = threading.Lock()
+# Processes started by execute
+_processes: typing.Dict[int, subprocess.Popen] = {}
+# Processes started with new_session on Linux and macOS, each one leads its own process group
+_process_groups: typing.Set[int] = set()
+
 
 def find_process_by_port(port: int) -> typing.List[int]:
     pid_list = []
@@ -25,10 +36,31 @@ def find_process_by_port(port: int) -> typing.List[int]:
     return pid_list
 
 
-def find_free_port(start: int, step: int):
-    while find_process_by_port(start):
-        start += step
-    return start
+def is_port_free(port: int) -> bool:
+    # Windows allows to bind a wildcard address when the port is bound to localhost, so both are checked
+    for host in ('127.0.0.1', ''):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind((host, port))
+            except OSError:
+                return False
+    return True
+
+
+def find_free_port(start: int, step: int, stop: typing.Optional[int] = None):
+    port = start
+    with _ports_lock:
+        while port in _reserved_ports or not is_port_free(port):
+            port += step
+            if stop is not None and port >= stop:
+                raise RuntimeError(f'No free port in range {start}-{stop} with step {step}')
+        _reserved_ports.add(port)
+    return port
+
+
+def release_port(port: int):
+    with _ports_lock:
+        _reserved_ports.discard(port)
 
 
 @allure.step('Kill process')
@@ -39,11 +71,25 @@ def kill_process(pid):
         if get_platform() == "Windows":
             subprocess.call(f"taskkill /F /T /PID {str(pid)}")
         elif get_platform() in ["Linux", "Darwin"]:
-            os.kill(pid, signal.SIGKILL)
+            if pid in _process_groups:
+                # Kill the whole process group, e.g. startaut together with the application it started
+                os.killpg(pid, signal.SIGKILL)
+            else:
+                os.kill(pid, signal.SIGKILL)
         else:
             raise NotImplementedError(f"Unsupported platform: {get_platform()}")
     except Exception as e:
-        print(f"Failed to terminate process {pid}: {e}")
+        LOG.warning(f'Failed to terminate process {pid}: {e}')
+
+
+def kill_process_groups():
+    """Kills process groups started with new_session, they do not get the Ctrl+C of the terminal"""
+    for pid in list(_process_groups):
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except OSError:
+            pass
+    _process_groups.clear()
 
 
 @allure.step('System execute command')
@@ -52,12 +98,70 @@ def execute(
         stderr=subprocess.STDOUT,
         stdout=subprocess.STDOUT,
         shell=False,
+        env=None,
+        pass_fds=(),
+        new_session=False,
 ):
     LOG.info('Executing: %s', command)
-    process = subprocess.Popen(command, shell=shell, stderr=stderr, stdout=stdout)
+    # A new session lets kill_process stop the process together with its children, e.g. startaut and the AUT
+    new_session = new_session and get_platform() != "Windows"
+    process = subprocess.Popen(
+        command,
+        shell=shell,
+        stderr=stderr,
+        stdout=stdout,
+        env=env,
+        pass_fds=pass_fds,
+        start_new_session=new_session
+    )
+    _processes[process.pid] = process
+    if new_session:
+        _process_groups.add(process.pid)
     return process.pid
 
 
+def wait_for_exit(pid: int, timeout_sec: float = configs.timeouts.PROCESS_TIMEOUT_SEC) -> bool:
+    process = _processes.get(pid)
+    if process is None:
+        try:
+            psutil.Process(pid).wait(timeout_sec)
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.TimeoutExpired:
+            return False
+        return True
+
+    # Linux notifies about process exit through a pidfd, Popen.wait then only reaps the process
+    if hasattr(os, 'pidfd_open') and process.returncode is None:
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            pass
+        else:
+            try:
+                if not select.select([pidfd], [], [], timeout_sec)[0]:
+                    return False
+            finally:
+                os.close(pidfd)
+    try:
+        process.wait(timeout_sec)
+    except subprocess.TimeoutExpired:
+        return False
+    del _processes[pid]
+    _process_groups.discard(pid)
+    return True
+
+
+@allure.step('Stop process')
+def stop_process(pid: int, timeout_sec: float = configs.timeouts.PROCESS_TIMEOUT_SEC) -> bool:
+    kill_process(pid)
+    if wait_for_exit(pid, timeout_sec):
+        LOG.debug(f'Process {pid} exited')
+        return True
+    LOG.warning(f'Process {pid} is still running after {timeout_sec} seconds')
+    return False
+
+
 @allure.step('System run command')
 def run(
         command: list,
@@ -1,12 +1,60 @@
+import errno
+import hashlib
 import logging
 import os
 import pathlib
 import shutil
+import tempfile
+import threading
+import typing
 
 import allure
 
 LOG = logging.getLogger(__name__)
 
+# Linux ioctl request to share file extents (reflink) on btrfs, xfs and other copy-on-write filesystems
+_FICLONE = 0x40049409
+# Directories with content addressed files, they are never modified in place and can be hardlinked
+_IMMUTABLE_DIRS = ('ipfs',)
+_reflink_supported = os.name == 'posix'
+_snapshot_templates: typing.Dict[str, 'SystemPath'] = {}
+_snapshot_locks: typing.Dict[str, threading.Lock] = {}
+_snapshot_locks_lock = threading.Lock()
+
+
+def _reflink(src: str, dst: str) -> bool:
+    global _reflink_supported
+    if not _reflink_supported:
+        return False
+    try:
+        import fcntl
+        with open(src, 'rb') as src_file, open(dst, 'wb') as dst_file:
+            fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    except (ImportError, OSError) as err:
+        if getattr(err, 'errno', None) in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, None):
+            LOG.debug('Reflinks are not supported, falling back to copies: %s', err)
+            _reflink_supported = False
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _snapshot_file(src: str, dst: str) -> str:
+    if any(part in _IMMUTABLE_DIRS for part in pathlib.PurePath(src).parts):
+        try:
+            os.link(src, dst)
+            return dst
+        except OSError:
+            pass
+    if _reflink(src, dst):
+        return dst
+    return shutil.copy2(src, dst)
+
+
+def _snapshot_lock(source: str) -> threading.Lock:
+    with _snapshot_locks_lock:
+        return _snapshot_locks.setdefault(source, threading.Lock())
+
 
 class SystemPath(pathlib.Path):
     _accessor = pathlib._normal_accessor  # noqa
@@ -19,3 +67,29 @@ class SystemPath(pathlib.Path):
     @allure.step('Copy path')
     def copy_to(self, destination: 'SystemPath'):
         shutil.copytree(self, destination, dirs_exist_ok=True)
+
+    @allure.step('Snapshot path')
+    def snapshot_to(self, destination: 'SystemPath', templates_dir: 'SystemPath'):
+        """Copies the directory through a session template that is copied from the source only once.
+
+        Content addressed files are hardlinked to the template, others are reflinked where the filesystem
+        supports it and copied otherwise, so the template stays unchanged by the application.
+        The template is built in a temporary directory and moved into place, threads snapshotting the same
+        source wait for it.
+        """
+        with _snapshot_lock(str(self)):
+            template = _snapshot_templates.get(str(self))
+            if template is None or not template.exists():
+                template = templates_dir / f'{self.name}_{hashlib.md5(str(self).encode()).hexdigest()[:8]}'
+                templates_dir.mkdir(parents=True, exist_ok=True)
+                staging = SystemPath(tempfile.mkdtemp(prefix=f'.{template.name}_', dir=templates_dir))
+                try:
+                    self.copy_to(staging)
+                    if template.exists():
+                        template.rmtree()
+                    os.replace(staging, template)
+                except Exception:
+                    staging.rmtree(ignore_errors=True)
+                    raise
+                _snapshot_templates[str(self)] = template
+        shutil.copytree(template, destination, copy_function=_snapshot_file, dirs_exist_ok=True)
@@ -0,0 +1,63 @@
+import logging
+import os
+import select
+
+import configs
+from scripts.utils import local_system
+
+LOG = logging.getLogger(__name__)
+
+
+class VirtualDisplay:
+    """Xvfb server on a free display number.
+
+    Xvfb picks the display number itself and reports it through "-displayfd" once it accepts
+    connections, so displays of parallel workers do not collide and no polling is needed.
+    """
+
+    def __init__(self, screen: str = configs.system.VIRTUAL_DISPLAY_SCREEN):
+        self.screen = screen
+        self.pid = None
+        self.name = None
+
+    def __str__(self):
+        return f'{type(self).__qualname__}({self.name})'
+
+    def start(self) -> 'VirtualDisplay':
+        read_fd, write_fd = os.pipe()
+        try:
+            cmd = ['Xvfb', '-displayfd', str(write_fd), '-screen', '0', self.screen, '-nolisten', 'tcp']
+            with open(configs.AUT_LOG_FILE, "ab") as log:
+                self.pid = local_system.execute(cmd, stderr=log, stdout=log, pass_fds=(write_fd,))
+            os.close(write_fd)
+            write_fd = None
+            if not select.select([read_fd], [], [], configs.timeouts.PROCESS_TIMEOUT_SEC)[0]:
+                raise TimeoutError(f'Xvfb did not report a display within {configs.timeouts.PROCESS_TIMEOUT_SEC} s')
+            number = os.read(read_fd, 16).decode().strip()
+            if not number:
+                raise RuntimeError('Xvfb exited before reporting a display')
+        except Exception as err:
+            LOG.error('Failed to start virtual display: %s', err)
+            self.stop()
+            raise err
+        finally:
+            os.close(read_fd)
+            if write_fd is not None:
+                os.close(write_fd)
+        self.name = f':{number}'
+        LOG.info('Started virtual display %s with screen %s under PID: %d', self.name, self.screen, self.pid)
+        return self
+
+    def stop(self):
+        if self.pid is None:
+            return
+        LOG.info('Stopping virtual display %s with PID: %d', self.name, self.pid)
+        local_system.stop_process(self.pid)
+        self.pid = None
+        self.name = None
+
+
+def use_display(name: str):
+    """Makes screenshots and applications started after this call use the display"""
+    configs.system.DISPLAY = name
+    os.environ['DISPLAY'] = name
@@ -0,0 +1,31 @@
+import pytest
+
+from gui.elements.object import QObject
+from gui.main_window import MainWindow
+from gui.objects_map import home_names, messaging_names, communities_names, settings_names, wallet_names
+from scripts.tools.benchmark import ScreenTransitionBenchmark, record
+
+
+@pytest.mark.parametrize('screen_name, button_name, target_name, leave_name', [
+    pytest.param('Home', 'home_button', home_names.home_container, 'open_messages_screen', id='home'),
+    pytest.param('Messages', 'messages_button', messaging_names.mainWindow_chatView_ChatView, 'open_home_screen',
+                 id='messages'),
+    pytest.param('Communities portal', 'communities_portal_button', communities_names.communityPortal,
+                 'open_home_screen', id='communities_portal'),
+    pytest.param('Settings', 'settings_button', settings_names.mainWindow_ProfileLayout, 'open_home_screen',
+                 id='settings'),
+    pytest.param('Wallet', 'wallet_button', wallet_names.mainWindow_WalletLayout, 'open_home_screen', id='wallet'),
+])
+def test_main_screens_loading_time(main_screen: MainWindow, screen_name, button_name, target_name, leave_name,
+                                   run_metadata):
+    left_panel = main_screen.left_panel
+    leave = getattr(left_panel, leave_name)
+    leave()
+
+    benchmark = ScreenTransitionBenchmark(
+        name=screen_name,
+        button=getattr(left_panel, button_name),
+        target=QObject(target_name),
+        leave=leave,
+    )
+    record(benchmark.run(run_metadata))
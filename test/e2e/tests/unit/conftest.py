@@ -0,0 +1,12 @@
+import pytest
+
+
+# Unit tests need no Squish server, display or AUT, the autouse fixtures of the suite are overridden here
+@pytest.fixture(scope='session', autouse=True)
+def setup_session_scope():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def setup_function_scope():
+    yield
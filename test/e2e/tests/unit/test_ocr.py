@@ -0,0 +1,88 @@
+import types
+
+import numpy as np
+import pytest
+
+from scripts.tools import ocr
+from scripts.tools.ocr import Ocr
+
+
+class _Constants:
+    # Like tesserocr.OEM and tesserocr.PSM: int constants on a class that can not be instantiated
+    def __new__(cls, *args, **kwargs):
+        raise TypeError(f'cannot create \'{cls.__name__}\' instances')
+
+
+class FakeOEM(_Constants):
+    DEFAULT = 3
+
+
+class FakePSM(_Constants):
+    AUTO = 3
+    SINGLE_LINE = 7
+
+
+class FakeApi:
+    instances = []
+
+    def __init__(self, lang, oem):
+        self.lang = lang
+        self.oem = oem
+        self.variables = {}
+        self.psm = None
+        self.ended = False
+        FakeApi.instances.append(self)
+
+    def Clear(self):
+        pass
+
+    def SetPageSegMode(self, psm):
+        self.psm = psm
+
+    def SetVariable(self, name, value):
+        self.variables[name] = value
+
+    def SetImage(self, image):
+        self.image = image
+
+    def GetUTF8Text(self):
+        return f'text {len(FakeApi.instances)}'
+
+    def End(self):
+        self.ended = True
+
+
+@pytest.fixture
+def tesserocr_stub(monkeypatch):
+    FakeApi.instances = []
+    module = types.SimpleNamespace(PyTessBaseAPI=FakeApi, OEM=FakeOEM, PSM=FakePSM)
+    monkeypatch.setattr(ocr, 'tesserocr', module)
+    yield module
+    Ocr.close()
+
+
+def test_ocr_passes_engine_and_page_segmentation_modes_as_ints(tesserocr_stub):
+    view = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    assert Ocr.image_to_string(view, config='--oem 1 --psm 7') == 'text 1'
+    api = FakeApi.instances[0]
+    assert (api.lang, api.oem, api.psm) == ('eng', 1, 7)
+
+    Ocr.image_to_string(np.ones((4, 4, 3), dtype=np.uint8), config='-l deu')
+    assert FakeApi.instances[1].psm == FakePSM.AUTO
+
+
+def test_ocr_keeps_variables_of_configs_apart(tesserocr_stub):
+    view = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    Ocr.image_to_string(view, config='-c tessedit_char_whitelist=0123456789')
+    Ocr.image_to_string(view, config='')
+    assert len(FakeApi.instances) == 2, 'Configs with other variables must not share an API'
+    assert FakeApi.instances[0].variables == {'tessedit_char_whitelist': '0123456789'}
+    assert FakeApi.instances[1].variables == {}
+
+    Ocr.image_to_string(view, config='')
+    assert len(FakeApi.instances) == 2, 'Results are memoized by image and config'
+
+    Ocr.close()
+    assert all(api.ended for api in FakeApi.instances)
@@ -1,18 +1,33 @@
+import asyncio
 import multiprocessing
 import os
 import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
 from .config import get_config, setup_logging, log_test_start, log_test_end
 from .config.logging_config import get_logger, LoggingConfig
 from .utils.screenshot import save_screenshot, save_page_source
-from core.stash_keys import MULTI_DEVICE_MANAGERS_KEY
-from core.capacity_reserver import set_shared_pending_counter
-from core.shared_counter import FileBasedCounter, create_shared_counter
+from core.providers.browserstack_status import SessionStatusUpdate
+from core.stash_keys import DEVICE_REQUEST_KEY, MULTI_DEVICE_MANAGERS_KEY, NEXT_ITEM_KEY
+from core.capacity_reserver import set_shared_pending_counter, set_shared_plan_cache
+from core.session_prewarmer import (
+    create_session_prewarmer,
+    get_session_prewarmer,
+    set_session_prewarmer,
+)
+from core.session_recycler import drain_session_recycler
+from core.session_runtime import get_session_runtime, shutdown_session_runtime
+from core.shared_counter import (
+    FileBasedCache,
+    FileBasedCounter,
+    create_shared_cache,
+    create_shared_counter,
+)
 
 
 # Expose fixture modules without star imports
@@ -29,7 +44,12 @@ pytest_plugins = [
 _logging_setup = None
 _saved_failure_logs: List[Path] = []
 _bs_pending_counter = None
+_bs_plan_cache = None
 _counter_manager: Optional[Any] = None
+# Last status per BrowserStack session not sent yet, recycled sessions are reported by every test that used them
+_deferred_status_reports: Dict[str, Tuple[Any, Any]] = {}
+# Task on the session runtime loop sending _deferred_status_reports, one at a time to keep updates in order
+_deferred_status_task: Optional["asyncio.Task"] = None
 
 
 def _extract_summary_details(test_report) -> dict[str, str | int | None]:
@@ -150,10 +170,10 @@ def pytest_configure(config):
         if hasattr(config.option, "htmlpath") and config.option.htmlpath:
             logger.info("  HTML report: %s", config.option.htmlpath)
 
-    global _bs_pending_counter, _counter_manager
+    global _bs_pending_counter, _bs_plan_cache, _counter_manager
 
     if not hasattr(config, "workerinput"):
-        # Main process: create file-based shared counter
+        # Main process: create file-based shared counter and plan status cache
         try:
             config_obj = get_config()
             base_dir = Path(config_obj.reports_dir).parent / ".shared"
@@ -164,8 +184,11 @@ def pytest_configure(config):
         _bs_pending_counter = counter
         _counter_manager = None
         set_shared_pending_counter(counter)
+
+        _bs_plan_cache = create_shared_cache(base_dir=base_dir)
+        set_shared_plan_cache(_bs_plan_cache)
     else:
-        # Worker process: create counter pointing to same file
+        # Worker process: create counter and cache pointing to same files
         counter_path = config.workerinput.get("bs_pending_counter_path")
         if counter_path:
             counter = FileBasedCounter(Path(counter_path), initial_value=0)
@@ -175,6 +198,10 @@ def pytest_configure(config):
             _bs_pending_counter = None
             set_shared_pending_counter(None)
 
+        plan_cache_path = config.workerinput.get("bs_plan_cache_path")
+        _bs_plan_cache = FileBasedCache(Path(plan_cache_path)) if plan_cache_path else None
+        set_shared_plan_cache(_bs_plan_cache)
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -191,15 +218,27 @@ def test_environment(request):
 
 
 def pytest_configure_node(node):
-    """Share counter file path with worker nodes."""
+    """Share counter and plan cache file paths with worker nodes."""
     if _bs_pending_counter is not None and hasattr(_bs_pending_counter, "_file_path"):
         node.workerinput["bs_pending_counter_path"] = str(_bs_pending_counter._file_path)
+    if _bs_plan_cache is not None:
+        node.workerinput["bs_plan_cache_path"] = str(_bs_plan_cache._file_path)
 
 
 def pytest_unconfigure(config):
-    """Cleanup shared counter."""
+    """Flush status reports, quit recycled sessions, stop the session runtime and cleanup shared state."""
+    prewarmer = get_session_prewarmer()
+    if prewarmer is not None:
+        prewarmer.wait()
+        set_session_prewarmer(None)
+    if _deferred_status_reports or _deferred_status_task is not None:
+        get_session_runtime().run(_flush_deferred_status_reports())
+    drain_session_recycler()
+    shutdown_session_runtime()
     set_shared_pending_counter(None)
+    set_shared_plan_cache(None)
     globals()["_bs_pending_counter"] = None
+    globals()["_bs_plan_cache"] = None
     global _counter_manager
     _counter_manager = None
 
@@ -235,9 +274,36 @@ def pytest_runtest_setup(item):
         markers=[mark.name for mark in item.iter_markers()],
     )
 
+    # Sessions pre-warmed for this test must be in the recycler before its fixtures run
+    prewarmer = get_session_prewarmer()
+    if prewarmer is not None:
+        prewarmer.wait()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    item.stash[NEXT_ITEM_KEY] = nextitem
+    yield
+
+
+def pytest_runtest_call(item):
+    """Pre-warm the sessions of the next test while this one runs."""
+    prewarmer = get_session_prewarmer()
+    nextitem = item.stash.get(NEXT_ITEM_KEY, None)
+    if prewarmer is None or nextitem is None:
+        return
+    request = nextitem.stash.get(DEVICE_REQUEST_KEY, None)
+    if request is None:
+        return
+
+    expected_idle = Counter()
+    for _session_managers, pool, _environment in item.stash.get(MULTI_DEVICE_MANAGERS_KEY, []):
+        expected_idle.update(pool.recyclable_keys())
+    prewarmer.start(request, expected_idle)
+
 
 def pytest_collection_modifyitems(config, items):
-    """Automatically add single_device marker to tests with device_count(1)."""
+    """Add single_device marker to tests with device_count(1) and record device requests for pre-warming."""
     for item in items:
         # Check if test has device_count marker with value 1
         device_count_marker = item.get_closest_marker("device_count")
@@ -255,6 +321,30 @@ def pytest_collection_modifyitems(config, items):
             if count == 1:
                 item.add_marker(pytest.mark.single_device)
 
+    _configure_session_prewarming(config, items)
+
+
+def _configure_session_prewarming(config, items) -> None:
+    from core.config_manager import ConfigurationManager
+    from fixtures.multi_device_fixtures import device_request_for
+
+    environment = config.getoption("--env")
+    try:
+        env_config = ConfigurationManager().load_environment(environment)
+    except Exception as exc:
+        get_logger("conftest").debug("Session pre-warming disabled: %s", exc)
+        return
+
+    prewarmer = create_session_prewarmer(env_config)
+    set_session_prewarmer(prewarmer)
+    if prewarmer is None:
+        return
+
+    for item in items:
+        request = device_request_for(item, environment)
+        if request is not None:
+            item.stash[DEVICE_REQUEST_KEY] = request
+
 
 def pytest_runtest_teardown(item, nextitem):
     test_name = item.name
@@ -293,6 +383,141 @@ def _apply_test_cooldown(item) -> None:
     time.sleep(cooldown_seconds)
 
 
+def _session_ids_for_reporting(session_managers, logger) -> list:
+    sessions = []
+    for name, session_manager in session_managers.items():
+        session_id = session_manager.session_id
+
+        if not session_id and hasattr(session_manager, "driver") and session_manager.driver:
+            session_id = getattr(session_manager.driver, "session_id", None)
+            if session_id:
+                session_manager._session_id = session_id
+                logger.debug(
+                    "Captured session_id for %s from driver during reporting",
+                    name,
+                )
+
+        if session_id:
+            sessions.append((name, session_manager, session_id))
+        else:
+            logger.warning(
+                "Cannot report status for %s: no session_id available. "
+                "Session may remain 'running' on BrowserStack.",
+                name,
+            )
+    return sessions
+
+
+async def _finish_pools(pools, test_passed, report_status, report_reason, logger) -> None:
+    loop = asyncio.get_running_loop()
+
+    async def _cleanup(pool, environment):
+        try:
+            await pool.cleanup(recycle=test_passed)
+            logger.debug("Completed cleanup for pool (env=%s)", environment)
+        except Exception as e:
+            logger.warning("Failed to cleanup pool in hook: %s", e)
+
+    def _report(name, session_manager, session_id):
+        try:
+            session_manager.provider.report_session_status_via_api(
+                session_id, report_status, report_reason
+            )
+            logger.debug(
+                "Reported status '%s' for %s (session: %s)",
+                report_status,
+                name,
+                session_id[:8] if len(session_id) > 8 else session_id,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to report final status for %s via REST API: %s",
+                name,
+                e,
+            )
+
+    async def _report_batch(reporter, updates):
+        try:
+            sent = await reporter.report_all(updates)
+            if sent < len(updates):
+                logger.warning(
+                    "Failed to report final status for %d of %d session(s) via REST API",
+                    len(updates) - sent,
+                    len(updates),
+                )
+            else:
+                logger.debug("Reported status '%s' for %d session(s)", report_status, sent)
+        except Exception as e:
+            logger.warning("Failed to report final status via REST API: %s", e)
+
+    tasks = []
+    batches = {}
+    for pool, environment, sessions in pools:
+        tasks.append(_cleanup(pool, environment))
+        for name, session_manager, session_id in sessions:
+            provider = session_manager.provider
+            reporter = getattr(provider, "status_reporter", None)
+            if reporter is None:
+                # The runtime loop's default executor is the sized session runtime executor
+                tasks.append(loop.run_in_executor(None, _report, name, session_manager, session_id))
+                continue
+            _reporter, updates, _deferred = batches.setdefault(
+                id(reporter), (reporter, [], getattr(provider, "defer_status_reporting", False))
+            )
+            updates.append(SessionStatusUpdate(session_id, report_status, report_reason))
+
+    for reporter, updates, deferred in batches.values():
+        if deferred:
+            # Sent in the background, the next test does not wait for the HTTP round trips. Only sessions
+            # of passed tests are recycled, so a failed status is always the last one of its session.
+            for update in updates:
+                _deferred_status_reports[update.session_id] = (reporter, update)
+            _schedule_deferred_status_reports()
+        else:
+            tasks.append(_report_batch(reporter, updates))
+    await asyncio.gather(*tasks)
+
+
+def _schedule_deferred_status_reports() -> None:
+    """Start sending deferred statuses on the running loop unless a send is in progress."""
+
+    global _deferred_status_task
+    if _deferred_status_task is None or _deferred_status_task.done():
+        _deferred_status_task = asyncio.ensure_future(_send_deferred_status_reports())
+
+
+async def _send_deferred_status_reports() -> None:
+    # Statuses recorded while a batch is in flight go out with the next batch, after the older ones
+    logger = get_logger("conftest")
+    while _deferred_status_reports:
+        batches = {}
+        for reporter, update in _deferred_status_reports.values():
+            batches.setdefault(id(reporter), (reporter, []))[1].append(update)
+        _deferred_status_reports.clear()
+        for reporter, updates in batches.values():
+            try:
+                sent = await reporter.report_all(updates)
+            except Exception as e:
+                logger.warning("Failed to report final status via REST API: %s", e)
+                continue
+            if sent < len(updates):
+                logger.warning(
+                    "Failed to report final status for %d of %d session(s) via REST API",
+                    len(updates) - sent,
+                    len(updates),
+                )
+
+
+async def _flush_deferred_status_reports() -> None:
+    """Wait for the background send and send what is left."""
+
+    global _deferred_status_task
+    task, _deferred_status_task = _deferred_status_task, None
+    if task is not None:
+        await task
+    await _send_deferred_status_reports()
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
@@ -327,8 +552,6 @@ def pytest_runtest_makereport(item, call):
         logger.debug("Multi-device hook skipped in teardown: no multi_device_managers in stash")
         return
 
-    import asyncio
-    from core.session_manager import SessionManager
     logger = get_logger("conftest")
 
     rep_setup = getattr(item, "rep_setup", None)
@@ -364,81 +587,33 @@ def pytest_runtest_makereport(item, call):
         except Exception:
             global_reason = str(skipped_report.longrepr)
 
-    for session_managers, pool, environment in stash_entries:
-        # Always cleanup (all environments)
-        try:
-            try:
-                loop = asyncio.get_running_loop()
-                loop_running = True
-            except RuntimeError:
-                loop = asyncio.get_event_loop()
-                loop_running = False
-
-            if loop_running:
-                cleanup_loop = asyncio.new_event_loop()
-                try:
-                    cleanup_loop.run_until_complete(pool.cleanup())
-                    logger.debug("Completed cleanup for pool (env=%s)", environment)
-                finally:
-                    cleanup_loop.close()
-            else:
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                loop.run_until_complete(pool.cleanup())
-                logger.debug("Completed cleanup for pool (env=%s)", environment)
-        except Exception as e:
-            logger.warning("Failed to cleanup pool in hook: %s", e)
+    test_passed = not global_failed and not global_skipped
+
+    if global_skipped:
+        report_status = "skipped"
+        report_reason = global_reason
+    else:
+        report_status = "passed" if test_passed else "failed"
+        report_reason = global_reason if global_failed else None
 
+    pools = []
+    for session_managers, pool, environment in stash_entries:
         # Only report status for BrowserStack
         if environment != "browserstack":
             logger.debug("Skipping status reporting for environment: %s", environment)
+            pools.append((pool, environment, []))
             continue
+        # Resolve session ids before cleanup quits the drivers
+        pools.append((pool, environment, _session_ids_for_reporting(session_managers, logger)))
 
-        test_passed = not global_failed and not global_skipped
-        
-        for name, session_manager in session_managers.items():
-            if global_skipped:
-                report_status = "skipped"
-                report_reason = global_reason
-            else:
-                report_status = "passed" if test_passed else "failed"
-                report_reason = global_reason if global_failed else None
-
-            session_id = session_manager.session_id
-
-            if not session_id and hasattr(session_manager, "driver") and session_manager.driver:
-                session_id = getattr(session_manager.driver, "session_id", None)
-                if session_id:
-                    session_manager._session_id = session_id
-                    logger.debug(
-                        "Captured session_id for %s from driver during reporting",
-                        name,
-                    )
-
-            if session_id:
-                try:
-                    session_manager.provider.report_session_status_via_api(
-                        session_id, report_status, report_reason
-                    )
-                    logger.debug(
-                        "Reported status '%s' for %s (session: %s)",
-                        report_status,
-                        name,
-                        session_id[:8] if len(session_id) > 8 else session_id,
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to report final status for %s via REST API: %s",
-                        name,
-                        e,
-                    )
-            else:
-                logger.warning(
-                    "Cannot report status for %s: no session_id available. "
-                    "Session may remain 'running' on BrowserStack.",
-                    name,
-                )
+    # Cleanup and reporting of all pools and devices run concurrently on the session runtime.
+    # Always cleanup (all environments), sessions of passed tests may be kept for the next test
+    try:
+        get_session_runtime().run(
+            _finish_pools(pools, test_passed, report_status, report_reason, logger)
+        )
+    except Exception as e:
+        logger.warning("Failed to finish multi-device pools in hook: %s", e)
 
     # Get screenshot and page source artifacts
     try:
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from functools import partial
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from config.logging_config import get_logger
 from utils.exceptions import SessionManagementError
 from core.providers.browserstack_plan import BrowserStackPlanClient, BrowserStackPlanStatus
 
 _shared_pending_counter = None
+_shared_plan_cache = None
+_plan_clients: Dict[Tuple[str, str, int], BrowserStackPlanClient] = {}
+_plan_clients_lock = threading.Lock()
 
 
 def set_shared_pending_counter(counter: Any) -> None:
@@ -27,8 +31,23 @@ def get_shared_pending_counter() -> Any:
     return _shared_pending_counter
 
 
+def set_shared_plan_cache(cache: Any) -> None:
+    """Register the plan status cache shared across pytest workers."""
+
+    global _shared_plan_cache
+    _shared_plan_cache = cache
+    with _plan_clients_lock:
+        _plan_clients.clear()
+
+
+def get_shared_plan_cache() -> Any:
+    """Return the shared plan status cache if registered."""
+
+    return _shared_plan_cache
+
+
 def create_plan_client(env_config: Optional[Any]) -> Optional[BrowserStackPlanClient]:
-    """Create a BrowserStack Plan client when credentials are available."""
+    """Return the worker's BrowserStack Plan client for the credentials when they are available."""
 
     if not env_config or not getattr(env_config, "provider", None):
         return None
@@ -44,7 +63,18 @@ def create_plan_client(env_config: Optional[Any]) -> Optional[BrowserStackPlanCl
         return None
 
     cache_ttl = int(env_config.get_provider_option("plan_cache_ttl", 10))
-    return BrowserStackPlanClient(username, access_key, cache_ttl=cache_ttl)
+    # One client per credentials, so pools share its keep-alive connection
+    with _plan_clients_lock:
+        client = _plan_clients.get((username, access_key, cache_ttl))
+        if client is None:
+            client = BrowserStackPlanClient(
+                username,
+                access_key,
+                cache_ttl=cache_ttl,
+                shared_cache=get_shared_plan_cache(),
+            )
+            _plan_clients[(username, access_key, cache_ttl)] = client
+        return client
 
 
 class CapacityReserver:
@@ -119,6 +149,19 @@ class CapacityReserver:
             attempt += 1
             await asyncio.sleep(poll_interval)
 
+    async def try_reserve(self, count: int) -> bool:
+        """Reserve parallel capacity only if it is free right now, without waiting or queueing.
+
+        Used for speculative work, so plan limits are checked even when throttling is disabled.
+        """
+        if count <= 0:
+            return True
+
+        cfg = self._throttle_config
+        parallel_buffer = max(0, int(cfg.get("parallel_buffer", 0)))
+        status = await self._fetch_plan_status()
+        return self._try_reserve(count, status, parallel_buffer, 0, allow_queue=False)
+
     async def release(self, count: int) -> None:
         if count <= 0:
             return
@@ -131,6 +174,10 @@ class CapacityReserver:
 
         self._local_pending = max(0, self._local_pending - count)
 
+        # Reserved sessions are running now (or were never created), which cached plan usage does not show
+        if self._plan_client:
+            self._plan_client.invalidate_cache()
+
     async def _fetch_plan_status(self) -> Optional[BrowserStackPlanStatus]:
         if not self._plan_client:
             return None
@@ -145,13 +192,16 @@ class CapacityReserver:
         status: Optional[BrowserStackPlanStatus],
         parallel_buffer: int,
         queue_buffer: int,
+        allow_queue: bool = True,
     ) -> bool:
         if self._shared_counter:
             lock = self._shared_counter.get_lock()
             with lock:
                 shared_pending = lock.get_value()
 
-                if not self._has_capacity(count, status, shared_pending, parallel_buffer, queue_buffer):
+                if not self._has_capacity(
+                    count, status, shared_pending, parallel_buffer, queue_buffer, allow_queue
+                ):
                     return False
 
                 lock.set_value(shared_pending + count)
@@ -159,7 +209,9 @@ class CapacityReserver:
                 return True
         else:
             shared_pending = self._local_pending
-            if not self._has_capacity(count, status, shared_pending, parallel_buffer, queue_buffer):
+            if not self._has_capacity(
+                count, status, shared_pending, parallel_buffer, queue_buffer, allow_queue
+            ):
                 return False
             self._local_pending += count
             return True
@@ -171,6 +223,7 @@ class CapacityReserver:
         shared_pending: int,
         parallel_buffer: int,
         queue_buffer: int,
+        allow_queue: bool = True,
     ) -> bool:
         max_sessions = self._concurrency_limits.get("max_sessions")
 
@@ -203,7 +256,7 @@ class CapacityReserver:
         )
 
         return available_parallel >= count or (
-            available_queue is not None and available_queue >= count
+            allow_queue and available_queue is not None and available_queue >= count
         )
 
     def _commit_reservation(self, count: int) -> None:
@@ -9,11 +9,15 @@ from appium import webdriver
 from appium.options.common import AppiumOptions
 from appium.webdriver.appium_connection import AppiumConnection
 from selenium.webdriver.remote.client_config import ClientConfig
-import requests
 
 from .base import Provider, SessionMetadata
 from ..environment import ConfigurationError, DeviceConfig
 from .browserstack_plan import BrowserStackPlanClient, BrowserStackPlanStatus
+from .browserstack_status import (
+    BrowserStackStatusReporter,
+    SessionStatusUpdate,
+    get_status_reporter,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -49,6 +53,7 @@ class BrowserStackProvider(Provider):
             self.access_key,
             cache_ttl=plan_cache_ttl,
         )
+        self.status_reporting = dict(env_config.get_provider_option("status_reporting", {}) or {})
 
     def create_driver(
         self,
@@ -115,6 +120,20 @@ class BrowserStackProvider(Provider):
             return None
         return self._plan_client.get_plan_status(force_refresh=force_refresh)
 
+    @property
+    def status_reporter(self) -> BrowserStackStatusReporter:
+        """Reporter shared by all providers with these credentials."""
+        options = {
+            key: self.status_reporting[key]
+            for key in ("retries", "backoff_factor", "timeout", "pool_size")
+            if key in self.status_reporting
+        }
+        return get_status_reporter(self.username, self.access_key, **options)
+
+    @property
+    def defer_status_reporting(self) -> bool:
+        return bool(self.status_reporting.get("deferred", False))
+
     def report_session_status_via_api(
         self,
         session_id: Optional[str],
@@ -130,29 +149,7 @@ class BrowserStackProvider(Provider):
         if not session_id:
             return
 
-        url = (
-            "https://api-cloud.browserstack.com/app-automate/sessions/"
-            f"{session_id}.json"
-        )
-        payload: Dict[str, str] = {"status": status}
-        if reason:
-            payload["reason"] = reason
-
-        try:
-            response = requests.put(
-                url,
-                json=payload,
-                auth=(self.username, self.access_key),
-                headers={"Content-Type": "application/json"},
-                timeout=10,
-            )
-            response.raise_for_status()
-        except requests.RequestException as exc:  # pragma: no cover - network call
-            logger.debug(
-                "Failed to update BrowserStack session %s via REST API: %s",
-                session_id,
-                exc,
-            )
+        self.status_reporter.report(SessionStatusUpdate(session_id, status, reason))
 
     def _populate_metadata(
         self,
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import requests
 
@@ -37,7 +37,15 @@ class BrowserStackPlanStatus:
 
 
 class BrowserStackPlanClient:
-    """Thin wrapper around BrowserStack's plan API with basic caching."""
+    """Thin wrapper around BrowserStack's plan API with basic caching.
+
+    Requests share one keep-alive HTTP session. With a shared_cache (a
+    FileBasedCache shared by pytest-xdist workers) the plan is fetched at most
+    once per cache_ttl for all workers. force_refresh then accepts a value
+    fetched by any worker within refresh_max_age seconds, so workers refreshing
+    at the same moment still share one request; invalidate_cache() makes the
+    next call fetch.
+    """
 
     PLAN_ENDPOINT = "https://api-cloud.browserstack.com/app-automate/plan.json"
 
@@ -47,12 +55,18 @@ class BrowserStackPlanClient:
         access_key: str,
         *,
         cache_ttl: int = 10,
+        shared_cache: Any = None,
+        refresh_max_age: float = 1.0,
     ) -> None:
         self.username = username
         self.access_key = access_key
         self._cache_ttl = max(0, cache_ttl)
         self._cached_status: Optional[BrowserStackPlanStatus] = None
         self._cached_at: Optional[datetime] = None
+        self._shared_cache = shared_cache
+        self._refresh_max_age = max(0.0, refresh_max_age)
+        self._session = requests.Session()
+        self._session.auth = (username, access_key)
 
     def get_plan_status(
         self,
@@ -63,40 +77,40 @@ class BrowserStackPlanClient:
         """Fetch current plan utilisation details.
 
         Args:
-            force_refresh: Skip cached value even if still valid.
+            force_refresh: Skip cached value even if still valid. With a shared
+                cache, a value fetched within refresh_max_age seconds is used.
             timeout: HTTP timeout in seconds.
 
         Returns:
             Parsed plan status or None when unavailable.
         """
 
+        if self._shared_cache is not None:
+            max_age = self._cache_ttl
+            if force_refresh:
+                max_age = min(max_age, self._refresh_max_age)
+            entry = self._shared_cache.get_or_fetch(
+                max_age, lambda: self._fetch_shared_entry(timeout)
+            )
+            if entry is None:
+                return None
+            return self._parse(
+                entry["payload"], datetime.fromtimestamp(entry["timestamp"], timezone.utc)
+            )
+
         now = datetime.now(timezone.utc)
         if not force_refresh and self._cache_ttl and self._cached_status and self._cached_at:
             if now - self._cached_at <= timedelta(seconds=self._cache_ttl):
                 return self._cached_status
 
-        try:
-            response = requests.get(
-                self.PLAN_ENDPOINT,
-                auth=(self.username, self.access_key),
-                timeout=timeout,
-            )
-            response.raise_for_status()
-            payload = response.json()
-        except requests.RequestException as exc:  # pragma: no cover - network call
-            logger.debug("BrowserStack Plan API request failed: %s", exc)
+        payload = self._fetch_payload(timeout)
+        if payload is None:
             if force_refresh:
                 self._cached_status = None
                 self._cached_at = None
             return self._cached_status if not force_refresh else None
 
-        status = BrowserStackPlanStatus(
-            parallel_running=int(payload.get("parallel_sessions_running", 0)),
-            parallel_allowed=int(payload.get("parallel_sessions_max_allowed", 0)),
-            queued_sessions=int(payload.get("queued_sessions", 0)),
-            queued_allowed=int(payload.get("queued_sessions_max_allowed", 0)),
-            timestamp=now,
-        )
+        status = self._parse(payload, now)
 
         if self._cache_ttl:
             self._cached_status = status
@@ -104,6 +118,39 @@ class BrowserStackPlanClient:
 
         return status
 
+    def invalidate_cache(self) -> None:
+        """Drop cached plan status so the next request fetches it, in all workers."""
+
+        self._cached_status = None
+        self._cached_at = None
+        if self._shared_cache is not None:
+            self._shared_cache.invalidate()
+
+    def _fetch_payload(self, timeout: int) -> Optional[Dict[str, Any]]:
+        try:
+            response = self._session.get(self.PLAN_ENDPOINT, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as exc:  # pragma: no cover - network call
+            logger.debug("BrowserStack Plan API request failed: %s", exc)
+            return None
+
+    def _fetch_shared_entry(self, timeout: int) -> Optional[Dict[str, Any]]:
+        payload = self._fetch_payload(timeout)
+        if payload is None:
+            return None
+        return {"payload": payload, "timestamp": datetime.now(timezone.utc).timestamp()}
+
+    @staticmethod
+    def _parse(payload: Dict[str, Any], timestamp: datetime) -> BrowserStackPlanStatus:
+        return BrowserStackPlanStatus(
+            parallel_running=int(payload.get("parallel_sessions_running", 0)),
+            parallel_allowed=int(payload.get("parallel_sessions_max_allowed", 0)),
+            queued_sessions=int(payload.get("queued_sessions", 0)),
+            queued_allowed=int(payload.get("queued_sessions_max_allowed", 0)),
+            timestamp=timestamp,
+        )
+
 
 __all__ = ["BrowserStackPlanClient", "BrowserStackPlanStatus"]
 
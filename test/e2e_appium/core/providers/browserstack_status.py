@@ -0,0 +1,112 @@
+"""BrowserStack REST session status reporting over a pooled HTTP session."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+_reporters: Dict[Tuple[str, str], "BrowserStackStatusReporter"] = {}
+_reporters_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SessionStatusUpdate:
+    """Final status of a BrowserStack session."""
+
+    session_id: str
+    status: str
+    reason: Optional[str] = None
+
+
+class BrowserStackStatusReporter:
+    """Sends session status updates over one keep-alive requests.Session.
+
+    Connection errors, 429 and 5xx responses are retried with exponential
+    backoff (honouring Retry-After) by the transport adapter.
+    """
+
+    SESSION_ENDPOINT = "https://api-cloud.browserstack.com/app-automate/sessions/{session_id}.json"
+
+    def __init__(
+        self,
+        username: str,
+        access_key: str,
+        *,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 10,
+        pool_size: int = 16,
+    ) -> None:
+        self.timeout = timeout
+        retry = Retry(
+            total=max(0, int(retries)),
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"PUT"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self._session = requests.Session()
+        self._session.auth = (username, access_key)
+        self._session.headers["Content-Type"] = "application/json"
+        self._session.mount("https://", adapter)
+
+    def report(self, update: SessionStatusUpdate) -> bool:
+        """Report a single session status. Returns False when the update failed after retries."""
+
+        payload: Dict[str, str] = {"status": update.status}
+        if update.reason:
+            payload["reason"] = update.reason
+
+        try:
+            response = self._session.put(
+                self.SESSION_ENDPOINT.format(session_id=update.session_id),
+                json=payload,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return True
+        except requests.RequestException as exc:  # pragma: no cover - network call
+            logger.debug(
+                "Failed to update BrowserStack session %s via REST API: %s",
+                update.session_id,
+                exc,
+            )
+            return False
+
+    async def report_all(self, updates: Iterable[SessionStatusUpdate]) -> int:
+        """Report all updates concurrently in the running loop's executor. Returns the number sent."""
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, self.report, update) for update in updates)
+        )
+        return sum(results)
+
+    def close(self) -> None:
+        self._session.close()
+
+
+def get_status_reporter(username: str, access_key: str, **options) -> BrowserStackStatusReporter:
+    """Return the process-wide reporter for the credentials so all sessions share its connections."""
+
+    with _reporters_lock:
+        reporter = _reporters.get((username, access_key))
+        if reporter is None:
+            reporter = BrowserStackStatusReporter(username, access_key, **options)
+            _reporters[(username, access_key)] = reporter
+        return reporter
+
+
+__all__ = ["BrowserStackStatusReporter", "SessionStatusUpdate", "get_status_reporter"]
@@ -7,7 +7,9 @@ capability and automatic cleanup.
 
 import asyncio
 import json
+from collections import Counter
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 T = TypeVar("T")
 
@@ -24,6 +26,8 @@ from core.capacity_reserver import (
     create_plan_client,
     get_shared_pending_counter,
 )
+from core.session_recycler import RecycledSession, SessionKey, get_session_recycler, session_key
+from core.session_runtime import get_session_runtime
 
 
 @dataclass
@@ -110,8 +114,12 @@ class SessionPool:
         self.environment = self.config.environment
         self.logger = get_logger("session_pool")
         self._sessions: Dict[str, Tuple[SessionManager, WebDriver]] = {}
+        self._session_keys: Dict[str, SessionKey] = {}
+        self._session_uses: Dict[str, int] = {}
         self._created = False
         self.env_config = self.config.env_config
+        self.recycler = get_session_recycler(self.env_config)
+        self.runtime = get_session_runtime(self.env_config)
 
         concurrency_limits = {"max_sessions": 1, "per_device_limit": 1}
         if self.env_config:
@@ -132,8 +140,8 @@ class SessionPool:
         loop: asyncio.AbstractEventLoop,
         func: Callable[[], T],
     ) -> T:
-        """Execute blocking work in the provided event loop executor."""
-        return await loop.run_in_executor(None, func)
+        """Execute blocking work in the session runtime's sized executor."""
+        return await loop.run_in_executor(self.runtime.executor, func)
 
     async def create_sessions(
         self,
@@ -203,21 +211,44 @@ class SessionPool:
             self.environment,
         )
 
-        capacity_reserved = False
+        keys = [
+            session_key(
+                self.environment,
+                device_tags,
+                self._device_override_for(i, device_configs, device_overrides),
+            )
+            for i in range(count)
+        ]
+
+        reserved_count = 0
         try:
-            await self.capacity_reserver.reserve(count)
-            capacity_reserved = True
-            if parallel_flag:
-                drivers = await self._create_parallel(
-                    count, device_configs, device_tags, device_overrides, test_nodeid
-                )
+            reused = await self._acquire_recycled(keys, test_nodeid)
+            indices = [i for i in range(count) if f"device_{i}" not in reused]
+
+            if indices:
+                await self.capacity_reserver.reserve(len(indices))
+                reserved_count = len(indices)
+                if parallel_flag:
+                    created = await self._create_parallel(
+                        indices, device_configs, device_tags, device_overrides, test_nodeid
+                    )
+                else:
+                    created = await self._create_sequential(
+                        indices, device_configs, device_tags, device_overrides, test_nodeid
+                    )
             else:
-                drivers = await self._create_sequential(
-                    count, device_configs, device_tags, device_overrides, test_nodeid
-                )
+                created = {}
+
+            for i in indices:
+                self._session_keys[f"device_{i}"] = keys[i]
+                self._session_uses[f"device_{i}"] = 1
 
+            drivers = {**reused, **created}
+            drivers = {f"device_{i}": drivers[f"device_{i}"] for i in range(count)}
             self._created = True
-            self.logger.info("Successfully created %d session(s)", len(drivers))
+            self.logger.info(
+                "Successfully created %d session(s) (%d reused)", len(drivers), len(reused)
+            )
             return drivers
 
         except Exception as e:
@@ -227,18 +258,131 @@ class SessionPool:
                 f"Failed to create {count} session(s): {e}"
             ) from e
         finally:
-            if capacity_reserved:
-                await self.capacity_reserver.release(count)
+            if reserved_count:
+                await self.capacity_reserver.release(reserved_count)
 
-    async def _create_parallel(
+    async def prewarm_sessions(
         self,
         count: int,
+        *,
+        expected_idle: Optional[Counter] = None,
+        idle_timeout: Optional[float] = None,
+    ) -> int:
+        """
+        Create sessions for an upcoming test and hand them to the worker's recycler.
+
+        Sessions already idle in the recycler, or expected to be released to it by
+        the running test, are not created again. Capacity is only taken when it is
+        free right now, so speculative sessions never queue or wait for a slot.
+
+        Args:
+            count: Number of sessions the upcoming test requests
+            expected_idle: Session keys the running test will likely release
+            idle_timeout: How long the recycler may keep the sessions unused
+
+        Returns:
+            Number of sessions created
+        """
+        if self.recycler is None:
+            return 0
+
+        device_overrides = (
+            list(self.config.device_overrides) if self.config.device_overrides is not None else None
+        )
+        device_tags = list(self.config.device_tags) if self.config.device_tags is not None else None
+        keys = [
+            session_key(
+                self.environment,
+                device_tags,
+                self._device_override_for(i, device_overrides, device_overrides),
+            )
+            for i in range(count)
+        ]
+
+        available = Counter(expected_idle or {})
+        available.update({key: self.recycler.count(key) for key in set(keys)})
+        indices = []
+        for i, key in enumerate(keys):
+            if available[key] > 0:
+                available[key] -= 1
+            else:
+                indices.append(i)
+        if not indices:
+            return 0
+
+        if not await self.capacity_reserver.try_reserve(len(indices)):
+            self.logger.info("No free capacity to pre-warm %d session(s)", len(indices))
+            return 0
+        try:
+            await self._create_parallel(indices, device_overrides, device_tags, device_overrides)
+        except SessionManagementError as e:
+            self.logger.warning("Failed to pre-warm sessions: %s", e)
+            return 0
+        finally:
+            await self.capacity_reserver.release(len(indices))
+
+        for i in indices:
+            session_manager, driver = self._sessions.pop(f"device_{i}")
+            self.recycler.release(keys[i], session_manager, driver, uses=0, idle_timeout=idle_timeout)
+        self.logger.info("Pre-warmed %d session(s)", len(indices))
+        return len(indices)
+
+    def recyclable_keys(self) -> Counter:
+        """Keys of the sessions the recycler would accept if the test passes."""
+        if self.recycler is None:
+            return Counter()
+        return Counter(
+            self._session_keys[device_name]
+            for device_name in self._sessions
+            if device_name in self._session_keys
+            and self._session_uses.get(device_name, 1) < self.recycler.max_reuse
+        )
+
+    @staticmethod
+    def _device_override_for(
+        index: int,
+        device_configs: Optional[List[Dict[str, Any]]],
+        device_overrides: Optional[List[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        device_override = device_overrides[index] if device_overrides and index < len(device_overrides) else None
+        device_config = device_configs[index] if device_configs and index < len(device_configs) else None
+        return device_override or device_config
+
+    async def _acquire_recycled(
+        self,
+        keys: List[SessionKey],
+        test_nodeid: Optional[str],
+    ) -> Dict[str, WebDriver]:
+        """Take sessions released by earlier tests from the worker's recycler."""
+        if self.recycler is None:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        tasks = [self._run_in_executor(loop, partial(self.recycler.acquire, key)) for key in keys]
+        results: List[Optional[RecycledSession]] = await asyncio.gather(*tasks)
+
+        drivers: Dict[str, WebDriver] = {}
+        for i, recycled in enumerate(results):
+            if recycled is None:
+                continue
+            device_name = f"device_{i}"
+            self._set_session_name(recycled.session_manager, recycled.driver, device_name, test_nodeid)
+            drivers[device_name] = recycled.driver
+            self._sessions[device_name] = (recycled.session_manager, recycled.driver)
+            self._session_keys[device_name] = recycled.key
+            self._session_uses[device_name] = recycled.uses + 1
+        return drivers
+
+    async def _create_parallel(
+        self,
+        indices: List[int],
         device_configs: Optional[List[Dict[str, Any]]],
         device_tags: Optional[List[str]],
         device_overrides: Optional[List[Dict[str, Any]]],
         test_nodeid: Optional[str] = None,
     ) -> Dict[str, WebDriver]:
-        """Create all sessions concurrently using asyncio."""
+        """Create the sessions for the given device indices concurrently using asyncio."""
+        count = len(indices)
         self.logger.debug("Creating %d sessions in parallel", count)
 
         tasks = [
@@ -249,7 +393,7 @@ class SessionPool:
                 device_override=device_overrides[i] if device_overrides and i < len(device_overrides) else None,
                 test_nodeid=test_nodeid,
             )
-            for i in range(count)
+            for i in indices
         ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -257,7 +401,7 @@ class SessionPool:
         drivers: Dict[str, WebDriver] = {}
         errors: List[Tuple[int, Exception]] = []
 
-        for i, result in enumerate(results):
+        for i, result in zip(indices, results):
             device_name = f"device_{i}"
             if isinstance(result, Exception):
                 errors.append((i, result))
@@ -285,18 +429,18 @@ class SessionPool:
 
     async def _create_sequential(
         self,
-        count: int,
+        indices: List[int],
         device_configs: Optional[List[Dict[str, Any]]],
         device_tags: Optional[List[str]],
         device_overrides: Optional[List[Dict[str, Any]]],
         test_nodeid: Optional[str] = None,
     ) -> Dict[str, WebDriver]:
-        """Create sessions one at a time."""
-        self.logger.debug("Creating %d sessions sequentially", count)
+        """Create the sessions for the given device indices one at a time."""
+        self.logger.debug("Creating %d sessions sequentially", len(indices))
 
         drivers: Dict[str, WebDriver] = {}
 
-        for i in range(count):
+        for i in indices:
             device_name = f"device_{i}"
             try:
                 session_manager, driver = await self._create_single_session(
@@ -318,6 +462,8 @@ class SessionPool:
                     f"Failed to create session {i} (device {device_name}): {e}"
                 ) from e
 
+        return drivers
+
     async def _create_single_session(
         self,
         device_index: int,
@@ -399,23 +545,40 @@ class SessionPool:
         except Exception as e:
             self.logger.debug("Failed to set session name for %s: %s", device_name, e)
 
-    async def cleanup(self, graceful: bool = True) -> None:
+    async def cleanup(self, graceful: bool = True, recycle: bool = False) -> None:
         """
         Clean up all sessions, handling errors gracefully.
 
         Args:
             graceful: If True, continue cleanup even if some sessions fail
+            recycle: If True and session reuse is enabled, hand sessions to the
+                worker's recycler instead of quitting them
         """
+        if recycle and self.recycler is not None:
+            for device_name, (session_manager, driver) in list(self._sessions.items()):
+                if self.recycler.release(
+                    self._session_keys[device_name],
+                    session_manager,
+                    driver,
+                    self._session_uses.get(device_name, 1),
+                ):
+                    del self._sessions[device_name]
+
         if not self._sessions:
+            self._session_keys.clear()
+            self._session_uses.clear()
+            self._created = False
             return
 
         self.logger.info("Cleaning up %d session(s)", len(self._sessions))
 
+        loop = asyncio.get_running_loop()
+
         async def _cleanup_session(
             device_name: str, session_manager: SessionManager, driver: WebDriver
         ) -> Optional[Exception]:
             try:
-                session_manager.cleanup_driver()
+                await self._run_in_executor(loop, session_manager.cleanup_driver)
                 self.logger.debug("Cleaned up session: %s", device_name)
                 return None
 
@@ -445,6 +608,8 @@ class SessionPool:
             )
 
         self._sessions.clear()
+        self._session_keys.clear()
+        self._session_uses.clear()
         self._created = False
         self.logger.info("Cleanup completed")
 
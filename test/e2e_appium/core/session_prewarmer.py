@@ -0,0 +1,99 @@
+"""Look-ahead provisioning of the sessions of the next test in a pytest worker."""
+
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from config.logging_config import get_logger
+from core.session_pool import PoolConfig, SessionPool
+from core.session_runtime import get_session_runtime
+
+_session_prewarmer: Optional["SessionPrewarmer"] = None
+
+
+@dataclass(frozen=True)
+class DeviceRequest:
+    """Sessions a collected test asks the devices fixture for."""
+
+    environment: str
+    count: int
+    device_overrides: Optional[List[Dict[str, Any]]] = None
+    device_tags: Optional[List[str]] = None
+
+
+class SessionPrewarmer:
+    """
+    Provisions the sessions of the next test on the session runtime while the current test runs.
+
+    Sessions are created through SessionPool.prewarm_sessions and wait in the
+    worker's SessionRecycler, where the pool of the next test picks them up.
+    Only one pre-warm runs at a time; the next test waits for it before its
+    own fixtures provision anything.
+    """
+
+    def __init__(self, *, idle_timeout: float = 240, logger=None) -> None:
+        self.idle_timeout = float(idle_timeout)
+        self._future: Optional[Future] = None
+        self._logger = logger or get_logger("session_prewarmer")
+
+    def start(self, request: DeviceRequest, expected_idle: Optional[Counter] = None) -> bool:
+        """Start provisioning for the request unless a pre-warm is still running."""
+
+        if self._future is not None and not self._future.done():
+            return False
+        self._future = get_session_runtime().submit(
+            self._prewarm(request, Counter(expected_idle or {}))
+        )
+        return True
+
+    def wait(self) -> None:
+        """Block until the running pre-warm, if any, has handed its sessions to the recycler."""
+
+        future, self._future = self._future, None
+        if future is not None:
+            future.result()
+
+    async def _prewarm(self, request: DeviceRequest, expected_idle: Counter) -> None:
+        try:
+            pool = SessionPool(
+                config=PoolConfig.from_environment(
+                    request.environment,
+                    device_overrides=request.device_overrides,
+                    device_tags=request.device_tags,
+                )
+            )
+            await pool.prewarm_sessions(
+                request.count,
+                expected_idle=expected_idle,
+                idle_timeout=self.idle_timeout,
+            )
+        except Exception as exc:
+            # Speculative work; the next test provisions its own sessions instead
+            self._logger.warning("Session pre-warm failed: %s", exc)
+
+
+def create_session_prewarmer(env_config: Optional[Any]) -> Optional[SessionPrewarmer]:
+    """Create a pre-warmer when session pre-warming is enabled for the environment."""
+
+    if not env_config or not hasattr(env_config, "execution"):
+        return None
+    prewarm_cfg = env_config.execution.get("session_prewarm", {})
+    if not prewarm_cfg.get("enabled", False):
+        return None
+    return SessionPrewarmer(idle_timeout=prewarm_cfg.get("idle_timeout", 240))
+
+
+def set_session_prewarmer(prewarmer: Optional[SessionPrewarmer]) -> None:
+    """Register the pre-warmer of the pytest worker."""
+
+    global _session_prewarmer
+    _session_prewarmer = prewarmer
+
+
+def get_session_prewarmer() -> Optional[SessionPrewarmer]:
+    """Return the pre-warmer if registered."""
+
+    return _session_prewarmer
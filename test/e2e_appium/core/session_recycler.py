@@ -0,0 +1,180 @@
+"""Worker-scoped recycling of Appium sessions between tests."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from appium.webdriver.webdriver import WebDriver
+
+from config.logging_config import get_logger
+from core.session_manager import SessionManager
+from utils.app_lifecycle_manager import AppLifecycleManager
+
+_session_recycler: Optional["SessionRecycler"] = None
+_recycler_lock = threading.Lock()
+
+SessionKey = Tuple[str, Tuple[str, ...], str]
+
+
+def session_key(
+    environment: str,
+    device_tags: Optional[List[str]] = None,
+    device_override: Optional[Dict[str, Any]] = None,
+) -> SessionKey:
+    """Sessions are only handed to tests that request the same environment, tags and override."""
+
+    override = json.dumps(device_override, sort_keys=True, default=str) if device_override else ""
+    return environment, tuple(sorted(device_tags or [])), override
+
+
+@dataclass
+class RecycledSession:
+    """Session kept alive after a passed test, or pre-warmed for the next one (uses=0)."""
+
+    key: SessionKey
+    session_manager: SessionManager
+    driver: WebDriver
+    uses: int
+    released_at: float = field(default_factory=time.monotonic)
+    idle_timeout: Optional[float] = None
+
+
+class SessionRecycler:
+    """
+    Keeps healthy sessions of passed tests for the next test in the same pytest worker.
+
+    Before a session is handed out again it is health checked and its app data is
+    cleared through AppLifecycleManager. Sessions that fail either step, sat idle
+    for longer than idle_timeout or served max_reuse tests are quit instead.
+    """
+
+    def __init__(self, *, max_reuse: int = 5, idle_timeout: float = 60, logger=None) -> None:
+        self.max_reuse = max(1, int(max_reuse))
+        self.idle_timeout = float(idle_timeout)
+        self._idle: Dict[SessionKey, List[RecycledSession]] = {}
+        self._lock = threading.Lock()
+        self._logger = logger or get_logger("session_recycler")
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(sessions) for sessions in self._idle.values())
+
+    def count(self, key: SessionKey) -> int:
+        with self._lock:
+            return len(self._idle.get(key, []))
+
+    def release(
+        self,
+        key: SessionKey,
+        session_manager: SessionManager,
+        driver: WebDriver,
+        uses: int,
+        idle_timeout: Optional[float] = None,
+    ) -> bool:
+        """Keep the session for a later test. Returns False when it must be quit instead."""
+
+        if uses >= self.max_reuse:
+            self._logger.debug(
+                "Session %s served %d test(s); not recycling", session_manager.session_id, uses
+            )
+            return False
+
+        with self._lock:
+            self._idle.setdefault(key, []).append(
+                RecycledSession(key, session_manager, driver, uses, idle_timeout=idle_timeout)
+            )
+        self._logger.debug("Recycled session %s (uses=%d)", session_manager.session_id, uses)
+        return True
+
+    def acquire(self, key: SessionKey) -> Optional[RecycledSession]:
+        """Return a healthy, reset session for the key or None. Blocking, run in an executor."""
+
+        while True:
+            with self._lock:
+                sessions = self._idle.get(key)
+                if not sessions:
+                    return None
+                session = sessions.pop(0)
+
+            idle_timeout = session.idle_timeout if session.idle_timeout is not None else self.idle_timeout
+            if time.monotonic() - session.released_at > idle_timeout:
+                self._logger.debug("Session %s idled out", session.session_manager.session_id)
+            # Pre-warmed sessions were never used, their app is still fresh
+            elif self._is_healthy(session) and (session.uses == 0 or self._reset(session)):
+                self._logger.info(
+                    "Reusing session %s (use %d of %d)",
+                    session.session_manager.session_id,
+                    session.uses + 1,
+                    self.max_reuse,
+                )
+                return session
+            self._retire(session)
+
+    def drain(self) -> None:
+        """Quit all idle sessions."""
+
+        with self._lock:
+            sessions = [session for idle in self._idle.values() for session in idle]
+            self._idle.clear()
+        for session in sessions:
+            self._retire(session)
+
+    def _is_healthy(self, session: RecycledSession) -> bool:
+        try:
+            session.driver.get_window_size()
+            return True
+        except Exception as exc:
+            self._logger.warning(
+                "Recycled session %s failed health check: %s", session.session_manager.session_id, exc
+            )
+            return False
+
+    def _reset(self, session: RecycledSession) -> bool:
+        if AppLifecycleManager(session.driver).reset_app_state():
+            return True
+        self._logger.warning("Failed to reset app state of session %s", session.session_manager.session_id)
+        return False
+
+    def _retire(self, session: RecycledSession) -> None:
+        # Status of the last test was reported, or is sent in the background, when the session was released
+        try:
+            session.session_manager.cleanup_driver()
+        except Exception as exc:
+            self._logger.warning("Failed to quit recycled session: %s", exc)
+
+
+def get_session_recycler(env_config: Optional[Any]) -> Optional[SessionRecycler]:
+    """Return the worker's session recycler when session reuse or pre-warming is enabled."""
+
+    global _session_recycler
+    if not env_config or not hasattr(env_config, "execution"):
+        return None
+    reuse_cfg = env_config.execution.get("session_reuse", {})
+    prewarm_cfg = env_config.execution.get("session_prewarm", {})
+    reuse_enabled = reuse_cfg.get("enabled", False)
+    if not reuse_enabled and not prewarm_cfg.get("enabled", False):
+        return None
+
+    with _recycler_lock:
+        if _session_recycler is None:
+            _session_recycler = SessionRecycler(
+                # Without reuse only pre-warmed sessions (uses=0) are kept
+                max_reuse=reuse_cfg.get("max_reuse", 5) if reuse_enabled else 1,
+                idle_timeout=reuse_cfg.get("idle_timeout", 60),
+            )
+        return _session_recycler
+
+
+def drain_session_recycler() -> None:
+    """Quit all sessions kept by the worker's recycler."""
+
+    global _session_recycler
+    with _recycler_lock:
+        recycler, _session_recycler = _session_recycler, None
+    if recycler is not None:
+        recycler.drain()
@@ -0,0 +1,94 @@
+"""Worker-scoped asyncio runtime for session creation, cleanup and status reporting."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Coroutine, Optional, TypeVar
+
+from config.logging_config import get_logger
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 16
+
+_session_runtime: Optional["SessionRuntime"] = None
+_runtime_lock = threading.Lock()
+
+
+class SessionRuntime:
+    """
+    Event loop running in a dedicated thread, with a sized executor for blocking work.
+
+    Appium and BrowserStack calls are synchronous, so SessionPool runs them in
+    the executor while coroutines of all pools share the loop. This replaces
+    creating event loops in pytest hooks and bounds the number of threads the
+    default executor would otherwise grow to.
+    """
+
+    def __init__(self, *, max_workers: int = DEFAULT_MAX_WORKERS, logger=None) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="session-runtime"
+        )
+        self._logger = logger or get_logger("session_runtime")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self.executor)
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="session-runtime-loop", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule the coroutine on the runtime loop and return a concurrent future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run the coroutine on the runtime loop and block the calling thread until it finishes."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SessionRuntime.run() cannot be called from the runtime loop")
+        return self.submit(coro).result(timeout)
+
+    def run_async(self, coro: Coroutine[Any, Any, T]) -> Awaitable[T]:
+        """Run the coroutine on the runtime loop and await it from another event loop."""
+        return asyncio.wrap_future(self.submit(coro))
+
+    def close(self) -> None:
+        """Stop the loop and wait for running executor work."""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self.executor.shutdown(wait=True)
+        self._logger.debug("Session runtime stopped")
+
+
+def get_session_runtime(env_config: Optional[Any] = None) -> SessionRuntime:
+    """Return the worker's session runtime, starting it on first use."""
+
+    global _session_runtime
+    with _runtime_lock:
+        if _session_runtime is None:
+            max_workers = DEFAULT_MAX_WORKERS
+            if env_config and hasattr(env_config, "execution"):
+                runtime_cfg = env_config.execution.get("session_runtime", {})
+                max_workers = runtime_cfg.get("max_workers", DEFAULT_MAX_WORKERS)
+            _session_runtime = SessionRuntime(max_workers=max_workers)
+        return _session_runtime
+
+
+def shutdown_session_runtime() -> None:
+    """Stop the worker's session runtime if it was started."""
+
+    global _session_runtime
+    with _runtime_lock:
+        runtime, _session_runtime = _session_runtime, None
+    if runtime is not None:
+        runtime.close()
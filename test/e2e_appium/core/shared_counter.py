@@ -1,10 +1,12 @@
-"""File-based shared counter for cross-process coordination with pytest-xdist."""
+"""File-based shared counter and cache for cross-process coordination with pytest-xdist."""
 
 import fcntl
+import json
 import os
 import tempfile
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 
 class FileBasedCounter:
@@ -129,6 +131,66 @@ class _FileLock:
         os.fsync(self._file.fileno())
 
 
+class FileBasedCache:
+    """Single JSON value shared by pytest-xdist workers and refreshed at most once per TTL.
+
+    The worker that finds the value stale fetches it while holding an exclusive
+    file lock, so the others wait for that fetch and read its result instead of
+    fetching themselves.
+    """
+
+    def __init__(self, file_path: Path):
+        self._file_path = Path(file_path)
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file_path.touch(exist_ok=True)
+
+    def get_or_fetch(self, ttl: float, fetch: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """Return the cached value if younger than ttl seconds, otherwise store and return fetch().
+
+        A None result of fetch is not stored.
+        """
+        with open(self._file_path, "r+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                entry = self._read(f)
+                if entry and time.time() - entry["fetched_at"] <= ttl:
+                    return entry["value"]
+
+                value = fetch()
+                if value is not None:
+                    self._write(f, {"fetched_at": time.time(), "value": value})
+                return value
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def invalidate(self) -> None:
+        """Make the next get_or_fetch call fetch a new value."""
+        with open(self._file_path, "r+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.truncate()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read(f) -> Optional[dict]:
+        f.seek(0)
+        content = f.read().strip()
+        if not content:
+            return None
+        try:
+            return json.loads(content)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _write(f, entry: dict) -> None:
+        f.seek(0)
+        f.write(json.dumps(entry))
+        f.truncate()
+        f.flush()
+
+
 def create_shared_counter(base_dir: Optional[Path] = None, counter_name: str = "bs_pending_counter") -> FileBasedCounter:
     """Create a shared counter in a directory accessible to all workers.
     
@@ -148,3 +210,24 @@ def create_shared_counter(base_dir: Optional[Path] = None, counter_name: str = "
     counter_path = base_dir / f"{counter_name}.txt"
     return FileBasedCounter(counter_path, initial_value=0)
 
+
+def create_shared_cache(base_dir: Optional[Path] = None, cache_name: str = "bs_plan_status") -> FileBasedCache:
+    """Create a shared cache in a directory accessible to all workers.
+
+    Args:
+        base_dir: Base directory for cache file (defaults to temp directory)
+        cache_name: Name of the cache file
+
+    Returns:
+        FileBasedCache instance
+    """
+    if base_dir is None:
+        base_dir = Path(tempfile.gettempdir()) / "pytest_xdist_shared"
+    else:
+        base_dir = Path(base_dir)
+
+    base_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = base_dir / f"{cache_name}.json"
+    # Start every run with a fresh value
+    cache_path.write_text("")
+    return FileBasedCache(cache_path)
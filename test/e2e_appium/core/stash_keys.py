@@ -8,6 +8,12 @@ from pytest import StashKey
 # Each entry is a tuple of (device_results, session_managers, session_pool)
 MULTI_DEVICE_MANAGERS_KEY: StashKey[List[Tuple[Any, Any, Any]]] = StashKey()
 
+# Sessions the devices fixture will provision for the item, set at collection when pre-warming
+DEVICE_REQUEST_KEY: StashKey[Any] = StashKey()
+
+# Item pytest runs after this one in the same worker, None for the last one
+NEXT_ITEM_KEY: StashKey[Any] = StashKey()
+
 
 
 
@@ -12,6 +12,7 @@ from core.config_manager import ConfigurationManager
 from core.device_context import DeviceContext
 from core.multi_device_context import MultiDeviceContext
 from core.session_pool import PoolConfig, SessionPool
+from core.session_prewarmer import DeviceRequest
 from core.stash_keys import MULTI_DEVICE_MANAGERS_KEY
 from utils.generators import generate_account_name
 from utils.exceptions import SessionManagementError
@@ -90,9 +91,13 @@ def _parse_device_markers(request, test_environment) -> tuple:
     Returns:
         Tuple of (device_count, device_overrides, device_tags)
     """
-    count_marker = request.node.get_closest_marker("device_count")
-    tags_marker = request.node.get_closest_marker("device_tags")
-    overrides_marker = request.node.get_closest_marker("device_overrides")
+    return _parse_node_device_markers(request.node, test_environment)
+
+
+def _parse_node_device_markers(node, test_environment) -> tuple:
+    count_marker = node.get_closest_marker("device_count")
+    tags_marker = node.get_closest_marker("device_tags")
+    overrides_marker = node.get_closest_marker("device_overrides")
 
     device_count = _resolve_count_marker(count_marker, default=DEFAULT_DEVICE_COUNT)
     device_tags = _extract_marker_list(tags_marker, "tags")
@@ -115,6 +120,19 @@ def _parse_device_markers(request, test_environment) -> tuple:
     return device_count, device_overrides, device_tags
 
 
+def device_request_for(item, test_environment) -> Optional[DeviceRequest]:
+    """Sessions the devices fixture will provision for a collected test, None if it does not use it."""
+    if "devices" not in getattr(item, "fixturenames", ()):
+        return None
+    device_count, device_overrides, device_tags = _parse_node_device_markers(item, test_environment)
+    return DeviceRequest(
+        environment=test_environment,
+        count=device_count,
+        device_overrides=list(device_overrides) if device_overrides else None,
+        device_tags=list(device_tags) if device_tags and not device_overrides else None,
+    )
+
+
 @pytest_asyncio.fixture(scope="function")
 async def devices(request, test_environment):
     """
@@ -157,10 +175,12 @@ async def devices(request, test_environment):
         )
         pool = SessionPool(config=pool_config)
 
-        # Create sessions
-        drivers = await pool.create_sessions(
-            count=device_count,
-            test_nodeid=request.node.nodeid,
+        # Create sessions on the worker's session runtime
+        drivers = await pool.runtime.run_async(
+            pool.create_sessions(
+                count=device_count,
+                test_nodeid=request.node.nodeid,
+            )
         )
 
         # Create device contexts
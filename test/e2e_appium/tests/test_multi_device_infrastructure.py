@@ -18,6 +18,34 @@ from utils.generators import generate_account_name
 from utils.multi_device_helpers import async_device_step
 
 
+class FakeSessionManager:
+    """Session manager stand-in for recycler and pool tests."""
+
+    def __init__(self, session_id="session-1"):
+        self.session_id = session_id
+        self.cleaned_up = False
+
+    def cleanup_driver(self):
+        self.cleaned_up = True
+
+
+class FakeDriver:
+    def get_window_size(self):
+        return {"width": 1, "height": 1}
+
+
+@pytest.fixture
+def fake_create_single_session():
+    """Replacement for SessionPool._create_single_session handing out numbered fake sessions."""
+
+    created = iter(range(100))
+
+    async def _create(**_kwargs):
+        return FakeSessionManager(f"session-{next(created)}"), FakeDriver()
+
+    return _create
+
+
 class TestMultiDeviceInfrastructure:
     """Test suite for multi-device infrastructure components."""
 
@@ -524,3 +552,215 @@ class TestMultiDeviceInfrastructure:
 
             with pytest.raises(SessionManagementError, match=r"allows only 5 parallel session\(s\)"):
                 await reserver.reserve(6)
+
+    async def test_session_recycler_hands_out_released_sessions(self, monkeypatch):
+        from core.session_recycler import SessionRecycler, session_key
+
+        recycler = SessionRecycler(max_reuse=2, idle_timeout=60)
+        monkeypatch.setattr(recycler, "_reset", lambda _session: True)
+
+        phone_key = session_key("browserstack", ["phone"])
+        session_manager, driver = FakeSessionManager(), FakeDriver()
+
+        assert recycler.release(phone_key, session_manager, driver, uses=1)
+        assert recycler.acquire(session_key("browserstack", ["tablet"])) is None, (
+            "Sessions must not be handed to tests requesting other device tags"
+        )
+
+        recycled = recycler.acquire(phone_key)
+        assert recycled is not None and recycled.driver is driver
+        assert recycler.idle_count == 0
+
+        assert not recycler.release(phone_key, session_manager, driver, uses=2), (
+            "Sessions that reached max_reuse must be quit"
+        )
+
+        recycler.release(phone_key, session_manager, driver, uses=1)
+        recycler.drain()
+        assert session_manager.cleaned_up
+        assert recycler.idle_count == 0
+
+    async def test_session_pool_reuses_sessions_of_passed_tests(self, monkeypatch, fake_create_single_session):
+        from unittest.mock import AsyncMock
+
+        from core.session_recycler import SessionRecycler
+
+        recycler = SessionRecycler(max_reuse=5)
+        monkeypatch.setattr(recycler, "_reset", lambda _session: True)
+
+        first_pool = SessionPool(config=PoolConfig(queue_throttle_config={"enabled": False}))
+        first_pool.recycler = recycler
+        monkeypatch.setattr(first_pool, "_create_single_session", fake_create_single_session)
+        first_drivers = await first_pool.create_sessions(count=2)
+        await first_pool.cleanup(recycle=True)
+        assert recycler.idle_count == 2
+
+        second_pool = SessionPool(config=PoolConfig(queue_throttle_config={"enabled": False}))
+        second_pool.recycler = recycler
+        create_mock = AsyncMock(side_effect=fake_create_single_session)
+        monkeypatch.setattr(second_pool, "_create_single_session", create_mock)
+        third_drivers = await second_pool.create_sessions(count=3)
+
+        assert create_mock.await_count == 1, "Only the third device should be provisioned"
+        assert list(third_drivers) == ["device_0", "device_1", "device_2"]
+        assert {id(d) for d in first_drivers.values()} <= {id(d) for d in third_drivers.values()}
+
+        await second_pool.cleanup(recycle=False)
+        assert recycler.idle_count == 0
+
+    async def test_session_pool_prewarms_sessions_for_next_test(self, monkeypatch, fake_create_single_session):
+        from collections import Counter
+        from unittest.mock import AsyncMock, Mock
+
+        from core.session_recycler import SessionRecycler, session_key
+
+        recycler = SessionRecycler(max_reuse=1)
+        reset_mock = Mock(return_value=True)
+        monkeypatch.setattr(recycler, "_reset", reset_mock)
+
+        prewarm_pool = SessionPool(config=PoolConfig(queue_throttle_config={"enabled": False}))
+        prewarm_pool.recycler = recycler
+        monkeypatch.setattr(prewarm_pool, "_create_single_session", fake_create_single_session)
+
+        monkeypatch.setattr(prewarm_pool.capacity_reserver, "try_reserve", AsyncMock(return_value=False))
+        assert await prewarm_pool.prewarm_sessions(2) == 0, "Pre-warming must not wait for capacity"
+
+        monkeypatch.setattr(prewarm_pool.capacity_reserver, "try_reserve", AsyncMock(return_value=True))
+        expected_idle = Counter({session_key("browserstack"): 1})
+        assert await prewarm_pool.prewarm_sessions(3, expected_idle=expected_idle) == 2, (
+            "Sessions the running test will release must not be provisioned again"
+        )
+        assert recycler.idle_count == 2 and prewarm_pool.session_count == 0
+
+        next_pool = SessionPool(config=PoolConfig(queue_throttle_config={"enabled": False}))
+        next_pool.recycler = recycler
+        create_mock = AsyncMock(side_effect=fake_create_single_session)
+        monkeypatch.setattr(next_pool, "_create_single_session", create_mock)
+        drivers = await next_pool.create_sessions(count=2)
+
+        assert len(drivers) == 2 and create_mock.await_count == 0
+        assert reset_mock.call_count == 0, "Pre-warmed sessions are fresh and need no reset"
+
+        await next_pool.cleanup(recycle=True)
+        assert recycler.idle_count == 0, "Used sessions must be quit when reuse is disabled"
+
+    async def test_session_runtime_cleans_up_devices_concurrently(self):
+        import threading
+        import time
+
+        from core.session_runtime import SessionRuntime
+
+        class SlowSessionManager:
+            def __init__(self):
+                self.thread_name = None
+
+            def cleanup_driver(self):
+                self.thread_name = threading.current_thread().name
+                time.sleep(0.3)
+
+        runtime = SessionRuntime(max_workers=4)
+        try:
+            pool = SessionPool(config=PoolConfig(queue_throttle_config={"enabled": False}))
+            pool.runtime = runtime
+            managers = [SlowSessionManager() for _ in range(3)]
+            for index, manager in enumerate(managers):
+                pool._sessions[f"device_{index}"] = (manager, object())
+
+            started_at = time.monotonic()
+            await runtime.run_async(pool.cleanup())
+            elapsed = time.monotonic() - started_at
+
+            assert elapsed < 0.8, f"Teardown should take the slowest device, took {elapsed:.2f}s"
+            assert all(m.thread_name.startswith("session-runtime") for m in managers)
+            assert pool.session_count == 0
+        finally:
+            runtime.close()
+
+    async def test_status_reporter_retries_and_reports_concurrently(self):
+        import json
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from core.providers.browserstack_status import BrowserStackStatusReporter, SessionStatusUpdate
+
+        received = []
+        failed_once = set()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_PUT(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.path.startswith("/flaky") and self.path not in failed_once:
+                    failed_once.add(self.path)
+                    self.send_response(503)
+                else:
+                    received.append((self.path, json.loads(body)))
+                    self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *_args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        reporter = BrowserStackStatusReporter("user", "key", retries=2, backoff_factor=0)
+        try:
+            reporter.SESSION_ENDPOINT = f"http://127.0.0.1:{server.server_port}/{{session_id}}.json"
+            reporter._session.mount("http://", reporter._session.get_adapter("https://"))
+
+            updates = [
+                SessionStatusUpdate("flaky-0", "failed", "boom"),
+                SessionStatusUpdate("session-1", "failed", "boom"),
+                SessionStatusUpdate("session-2", "failed", "boom"),
+            ]
+            assert await reporter.report_all(updates) == 3
+            assert sorted(path for path, _ in received) == [
+                "/flaky-0.json",
+                "/session-1.json",
+                "/session-2.json",
+            ]
+            assert all(payload == {"status": "failed", "reason": "boom"} for _, payload in received)
+        finally:
+            reporter.close()
+            server.shutdown()
+            server.server_close()
+
+    async def test_plan_status_is_fetched_once_per_ttl_across_workers(self, tmp_path, monkeypatch):
+        from core.providers.browserstack_plan import BrowserStackPlanClient
+        from core.shared_counter import FileBasedCache, create_shared_cache
+
+        cache = create_shared_cache(base_dir=tmp_path)
+        # Each worker opens the cache by path, as conftest does with the workerinput
+        clients = [
+            BrowserStackPlanClient("user", "key", cache_ttl=60, shared_cache=cache),
+            BrowserStackPlanClient("user", "key", cache_ttl=60, shared_cache=FileBasedCache(cache._file_path)),
+        ]
+        fetches = []
+
+        def fake_fetch_payload(_timeout):
+            fetches.append(1)
+            return {"parallel_sessions_running": len(fetches), "parallel_sessions_max_allowed": 5}
+
+        for client in clients:
+            monkeypatch.setattr(client, "_fetch_payload", fake_fetch_payload)
+
+        statuses = [client.get_plan_status(force_refresh=True) for client in clients * 2]
+        assert len(fetches) == 1
+        assert {status.parallel_running for status in statuses} == {1}
+        assert statuses[0].parallel_allowed == 5
+
+        clients[0].invalidate_cache()
+        assert clients[1].get_plan_status(force_refresh=True).parallel_running == 2
+        assert len(fetches) == 2
+
+        refreshing = BrowserStackPlanClient(
+            "user", "key", cache_ttl=60, shared_cache=FileBasedCache(cache._file_path), refresh_max_age=0
+        )
+        monkeypatch.setattr(refreshing, "_fetch_payload", fake_fetch_payload)
+        assert refreshing.get_plan_status(force_refresh=True).parallel_running == 3, (
+            "force_refresh must not return a value older than refresh_max_age"
+        )
+        assert clients[0].get_plan_status().parallel_running == 3
+        assert len(fetches) == 3
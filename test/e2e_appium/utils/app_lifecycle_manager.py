@@ -129,6 +129,34 @@ class AppLifecycleManager:
             self.logger.error("App restart with data cleared failed: %s", e)
             return False
 
+    def reset_app_state(self, app_package: Optional[str] = None) -> bool:
+        """
+        Clear app data through the Appium server and relaunch the app.
+
+        Unlike restart_app_with_data_cleared this does not need local ADB access,
+        so it also works for cloud sessions that are reused by the next test.
+
+        Returns:
+            bool: True if the app was cleared and its UI is ready
+        """
+        package = self._resolve_package(app_package)
+        if not package:
+            return False
+
+        self.logger.info("Resetting app state: %s", package)
+        try:
+            self.driver.execute_script("mobile: terminateApp", {"appId": package})
+        except Exception as terminate_err:
+            self.logger.debug("mobile: terminateApp failed (non-fatal): %s", terminate_err)
+
+        try:
+            self.driver.execute_script("mobile: clearApp", {"appId": package})
+        except Exception as e:
+            self.logger.error("Failed to clear app data: %s", e)
+            return False
+
+        return self.activate_app_with_ui_ready(package)
+
     def terminate_app(self, app_package: Optional[str] = None) -> bool:
         """Terminate the specified app."""
         package = self._resolve_package(app_package)